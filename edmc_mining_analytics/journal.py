@@ -11,9 +11,11 @@ import threading
 
 from .state import (
     MiningState,
+    ProspectKey,
+    add_prospected_sample,
     register_refinement,
-    recompute_histograms,
     recompute_market_sell_totals,
+    remember_prospect_key,
     reset_mining_state,
     update_rpm,
 )
@@ -51,6 +53,22 @@ class PendingShipUpdate:
 
 _PENDING_SHIP_UPDATE_TIMEOUT = timedelta(seconds=10)
 
+# Journal events whose handlers can change a value published into EDMC's shared state.
+_SHARED_STATE_EVENTS = frozenset(
+    {
+        "LaunchDrone",
+        "ProspectedAsteroid",
+        "Cargo",
+        "MiningRefined",
+        "SupercruiseEntry",
+        "FSDJump",
+        "MaterialCollected",
+        "LoadGame",
+        "Loadout",
+        "ShipyardSwap",
+    }
+)
+
 
 class JournalProcessor:
     """Transforms EDMC journal events into mining analytics state updates."""
@@ -82,10 +100,21 @@ class JournalProcessor:
         self._ring_anchor_name: Optional[str] = None
         self._ring_anchor_body_id: Optional[int] = None
         self._ring_anchor_system: Optional[str] = None
+        self._shared_state_stale = True
+        # Bin size behind the last published histogram; the UI can change it between events.
+        self._published_bin_size: Optional[int] = None
+        # isoformat() of mining_start, and the datetime it was formatted from.
+        self._mining_start_iso: Optional[str] = None
+        self._mining_start_iso_source: Optional[datetime] = None
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
+    def invalidate_shared_state(self) -> None:
+        """Republish the mining keys into EDMC's shared state on the next entry."""
+
+        self._shared_state_stale = True
+
     def handle_entry(self, entry: dict, shared_state: Optional[dict] = None) -> None:
         if not entry:
             return
@@ -211,11 +240,18 @@ class JournalProcessor:
             self._set_current_system(system_name)
             self._refresh_edsm()
 
-        if isinstance(shared_state, dict):
+        if isinstance(shared_state, dict) and (
+            self._shared_state_stale
+            or event in _SHARED_STATE_EVENTS
+            or "edmc_mining_active" not in shared_state
+            or self._state.histogram_bin_size != self._published_bin_size
+        ):
+            self._shared_state_stale = False
+            self._published_bin_size = self._state.histogram_bin_size
             shared_state.update(
                 {
                     "edmc_mining_active": self._state.is_mining,
-                    "edmc_mining_start": self._state.mining_start.isoformat() if self._state.mining_start else None,
+                    "edmc_mining_start": self._format_mining_start(),
                     "edmc_mining_prospected": self._state.prospected_count,
                     "edmc_mining_already_mined": self._state.already_mined_count,
                     "edmc_mining_cargo": dict(self._state.cargo_additions),
@@ -310,7 +346,7 @@ class JournalProcessor:
             _log.debug("Duplicate prospected asteroid detected; ignoring for stats")
             return
 
-        self._state.prospected_seen.add(key)
+        remember_prospect_key(self._state, key)
         self._state.prospected_count += 1
 
         if content_level:
@@ -332,10 +368,8 @@ class JournalProcessor:
                     proportion = float(proportion_raw)
                 except (TypeError, ValueError):
                     continue
-                normalized = name_raw.lower()
-                self._state.prospected_samples.setdefault(normalized, []).append(proportion)
+                add_prospected_sample(self._state, name_raw.lower(), proportion)
 
-        recompute_histograms(self._state)
         self._emit_mining_activity("ProspectedAsteroid")
         self._refresh_edsm()
 
@@ -1174,14 +1208,14 @@ class JournalProcessor:
             if self._state.mining_start:
                 _plugin_log.info(
                     "Mining started at %s (location=%s) - reason: %s",
-                    self._state.mining_start.isoformat(),
+                    self._format_mining_start(),
                     self._state.mining_location,
                     reason,
                 )
                 if _plugin_log is not _log:
                     _log.debug(
                         "Mining start details logged: time=%s location=%s reason=%s",
-                        self._state.mining_start.isoformat(),
+                        self._format_mining_start(),
                         self._state.mining_location,
                         reason,
                     )
@@ -1375,7 +1409,7 @@ class JournalProcessor:
             return value.replace(tzinfo=timezone.utc)
         return value
 
-    def _make_prospect_key(self, entry: dict) -> Optional[Tuple[str, Tuple[Tuple[str, float], ...]]]:
+    def _make_prospect_key(self, entry: dict) -> Optional[ProspectKey]:
         materials = entry.get("Materials")
         if not isinstance(materials, list):
             return None
@@ -1402,7 +1436,7 @@ class JournalProcessor:
         body_component = str(body) if isinstance(body, str) else ""
         content = str(entry.get("Content", ""))
         content_localised = str(entry.get("Content_Localised", ""))
-        return ("|".join(filter(None, (body_component, content, content_localised))), tuple(items))
+        return hash(("|".join(filter(None, (body_component, content, content_localised))), tuple(items)))
 
     @staticmethod
     def _extract_content_level(entry: dict) -> Optional[str]:
@@ -1445,6 +1479,15 @@ class JournalProcessor:
             data[self._format_cargo_name(commodity)] = round(rate, 3)
         return data
 
+    def _format_mining_start(self) -> Optional[str]:
+        start = self._state.mining_start
+        if start is None:
+            return None
+        if start is not self._mining_start_iso_source:
+            self._mining_start_iso = start.isoformat()
+            self._mining_start_iso_source = start
+        return self._mining_start_iso
+
     def _compute_total_tph(self) -> Optional[float]:
         if not self._state.mining_start:
             return None
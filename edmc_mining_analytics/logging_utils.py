@@ -66,7 +66,9 @@ def get_logger(suffix: str | None = None) -> logging.Logger:
 def set_log_level(level: int) -> None:
     """Update the base logger level (and implicitly its children)."""
 
-    BASE_LOGGER.setLevel(level)
+    # setLevel() flushes the isEnabledFor cache of every logger in the process.
+    if BASE_LOGGER.level != level:
+        BASE_LOGGER.setLevel(level)
 
 
 def install_exception_logging(logger: logging.Logger | None = None) -> None:
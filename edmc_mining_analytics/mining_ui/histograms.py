@@ -14,7 +14,7 @@ except ImportError as exc:  # pragma: no cover - EDMC always provides tkinter
 if TYPE_CHECKING:  # pragma: no cover
     from .main_mining_ui import edmcmaMiningUI
 
-from ..state import compute_percentage_stats
+from ..state import prospected_range
 
 
 def open_histogram_window(ui: "edmcmaMiningUI", commodity: str) -> None:
@@ -113,8 +113,8 @@ def draw_histogram(
     size = max(1, ui._state.histogram_bin_size)
     labels = {bin_index: ui._format_bin_label(bin_index, size) for bin_index in full_range}
 
-    stats = compute_percentage_stats(ui._state.prospected_samples.get(commodity, []))
-    average_percent = stats[1] if stats else None
+    stats = prospected_range(ui._state, commodity)
+    average_percent = stats[2] if stats else None
 
     label_font = tkfont.nametofont("TkDefaultFont")
     max_label_width = max((label_font.measure(text) for text in labels.values()), default=0)
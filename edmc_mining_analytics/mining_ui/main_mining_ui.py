@@ -32,7 +32,7 @@ from edmc_mining_analytics.tooltip import WidgetTooltip
 from edmc_mining_analytics.debugging import apply_frame_debugging, collect_frames
 from ..formatting import format_compact_number
 from ..estimated_sell import build_estimated_sell_breakdown
-from ..state import MiningState, compute_percentage_stats, update_rpm, resolve_commodity_display_name
+from ..state import MiningState, prospected_range, update_rpm, resolve_commodity_display_name
 from ..integrations.mining_inara import InaraClient
 from ..integrations.spansh_hotspots import (
     HotspotSearchResult,
@@ -148,6 +148,7 @@ class edmcmaMiningUI:
         self._pause_btn: Optional[ButtonType] = None
         self._commodities_headers: list[tk.Label] = []
         self._commodities_rows: list[list[tk.Label]] = []
+        self._commodity_click_actions: Dict[tk.Label, Callable[[], None]] = {}
         self._commodities_header_tooltips: list[WidgetTooltip] = []
         self._materials_header: Optional[tk.Frame] = None
         self._materials_frame: Optional[tk.Frame] = None
@@ -366,6 +367,7 @@ class edmcmaMiningUI:
         self._commodities_grid = commodities_widgets.grid_config
         self._commodities_headers = commodities_widgets.headers
         self._commodities_rows = []
+        self._commodity_click_actions = {}
         self._initialize_commodities_header_tooltips()
 
         total_container = tk.Frame(frame, highlightthickness=0, bd=0)
@@ -1683,11 +1685,18 @@ class edmcmaMiningUI:
                     pady=(0, 1),
                 )
                 label.grid_remove()
+                # Bound once; refreshes only swap the entry in _commodity_click_actions.
+                label.bind("<Button-1>", self._on_commodity_label_click)
                 self._theme.register(label)
                 row_labels.append(label)
             self._commodities_rows.append(row_labels)
         return self._commodities_rows[row_index]
 
+    def _on_commodity_label_click(self, event: tk.Event) -> None:
+        action = self._commodity_click_actions.get(event.widget)
+        if action is not None:
+            action()
+
     def _apply_label_style(
         self,
         label: tk.Label,
@@ -1841,6 +1850,8 @@ class edmcmaMiningUI:
         )
 
         link_fg = self._theme.link_color()
+        click_actions = self._commodity_click_actions
+        click_actions.clear()
 
         if not rows:
             row_labels = self._ensure_commodity_row(0)
@@ -1848,18 +1859,15 @@ class edmcmaMiningUI:
                 if col_index == 0:
                     self._apply_label_style(label, text="No mined commodities")
                     label.grid()
-                    label.unbind("<Button-1>")
                 else:
                     label.grid_remove()
-                    label.unbind("<Button-1>")
             # Hide any leftover rows beyond index 0
             for idx in range(1, len(self._commodities_rows)):
                 for label in self._commodities_rows[idx]:
                     label.grid_remove()
-                    label.unbind("<Button-1>")
             return
 
-        present_counts = {k: len(v) for k, v in self._state.prospected_samples.items()}
+        present_counts = {k: int(v[0]) for k, v in self._state.prospected_stats.items()}
         total_asteroids = self._state.prospected_count if self._state.prospected_count > 0 else 1
 
         for row_index, commodity in enumerate(rows):
@@ -1899,18 +1907,11 @@ class edmcmaMiningUI:
                     clickable = has_link
                     foreground = link_fg if has_link else None
                     if has_link:
-                        label.bind("<Button-1>", lambda _evt, name=commodity: self._inara.open_link(name))
-                    else:
-                        label.unbind("<Button-1>")
+                        click_actions[label] = partial(self._inara.open_link, commodity)
                 elif column["key"] == "range" and range_label:
                     clickable = True
                     foreground = link_fg
-                    label.bind(
-                        "<Button-1>",
-                        lambda _evt, name=commodity: self.open_histogram_window(name),
-                    )
-                else:
-                    label.unbind("<Button-1>")
+                    click_actions[label] = partial(self.open_histogram_window, commodity)
 
                 self._apply_label_style(
                     label,
@@ -1924,7 +1925,6 @@ class edmcmaMiningUI:
         for idx in range(len(rows), len(self._commodities_rows)):
             for label in self._commodities_rows[idx]:
                 label.grid_remove()
-                label.unbind("<Button-1>")
 
         # Display totals row similar to BGS-Tally
     def _populate_materials_table(self) -> None:
@@ -2372,23 +2372,12 @@ class edmcmaMiningUI:
     def _format_range_label(self, commodity: str) -> str:
         if commodity not in self._state.harvested_commodities:
             return ""
-        samples = self._state.prospected_samples.get(commodity)
-        if not samples:
-            return ""
-        numeric_samples: list[float] = []
-        for value in samples:
-            try:
-                numeric_samples.append(float(value))
-            except (TypeError, ValueError):
-                continue
-        if not numeric_samples:
-            return ""
-        if len(numeric_samples) == 1:
-            return f"{numeric_samples[0]:.0f}%"
-        stats = compute_percentage_stats(numeric_samples)
-        if not stats:
+        stats = prospected_range(self._state, commodity)
+        if stats is None:
             return ""
-        low, avg, high = stats
+        count, low, avg, high = stats
+        if count == 1:
+            return f"{low:.0f}%"
         return f"{low:.0f}%-{avg:.0f}%-{high:.0f}%"
 
     def _compute_total_tph(self) -> Optional[float]:
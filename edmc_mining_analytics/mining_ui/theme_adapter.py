@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
-from weakref import WeakSet
+import re
+import weakref
+from typing import Any, Callable, ClassVar, Dict, Optional
+from weakref import WeakKeyDictionary, WeakSet
 
 try:
     import tkinter as tk
@@ -11,15 +13,30 @@ try:
 except ImportError as exc:  # pragma: no cover - EDMC always provides tkinter
     raise RuntimeError("Tkinter must be available for EDMC plugins") from exc
 
-try:  # pragma: no cover - theme only exists inside EDMC runtime
-    from theme import theme as edmc_theme  # type: ignore[import]
-except ImportError:  # pragma: no cover
-    edmc_theme = None  # type: ignore[assignment]
+edmc_theme: Any = None
+edmc_config: Any = None
+_edmc_loaded = False
 
-try:  # pragma: no cover - config only available inside EDMC
-    from config import config as edmc_config  # type: ignore[import]
-except ImportError:  # pragma: no cover
-    edmc_config = None  # type: ignore[assignment]
+
+def _load_edmc_modules() -> None:
+    """Resolve EDMC's optional theme/config helpers once per process."""
+
+    global edmc_theme, edmc_config, _edmc_loaded
+    if _edmc_loaded:
+        return
+    _edmc_loaded = True
+
+    try:  # pragma: no cover - theme only exists inside EDMC runtime
+        from theme import theme as loaded_theme  # type: ignore[import]
+    except ImportError:  # pragma: no cover
+        loaded_theme = None
+    try:  # pragma: no cover - config only available inside EDMC
+        from config import config as loaded_config  # type: ignore[import]
+    except ImportError:  # pragma: no cover
+        loaded_config = None
+
+    edmc_theme = loaded_theme
+    edmc_config = loaded_config
 
 
 try:  # pragma: no cover - EDMC runtime provides logger helpers
@@ -31,24 +48,223 @@ except ImportError:  # pragma: no cover - fallback for local tooling
 else:  # pragma: no cover - executed inside EDMC
     _logger = get_main_logger()
 
+# Widgets styled through style_button/style_checkbox rather than the plain registry.
+_BUTTON_LIKE_TYPES = (tk.Button, ttk.Button, tk.Checkbutton, ttk.Checkbutton)
+
+_DEFAULT_PADDING = (12, 4)
+# Integer part of each plain numeric padding token ("12 4", "12,4", "12.5 4").
+_PADDING_TOKEN_RE = re.compile(r"(?:^|[\s,])([-+]?\d+)(?:\.\d*)?(?=[\s,]|$)")
+
+# Table stripe tint applied to the base colour, indexed by "is dark theme".
+_STRIPE_TINT_FACTORS = (0.98, 1.08)
+
+# Options captured before a button or checkbox is first restyled.
+_BUTTON_DEFAULT_KEYS = (
+    "background",
+    "foreground",
+    "activebackground",
+    "activeforeground",
+    "highlightbackground",
+    "highlightcolor",
+    "highlightthickness",
+    "bd",
+    "relief",
+    "style",
+    "padding",
+)
+_CHECKBOX_DEFAULT_KEYS = ("highlightthickness", "highlightbackground", "highlightcolor", "bd", "selectcolor")
+
+# Colour options pushed onto plain registered widgets.
+_WIDGET_STYLE_KEYS = frozenset({"background", "foreground"})
+
+# Button options mirrored verbatim onto the dark-theme alternate label.
+_MIRRORED_OPTION_KEYS = frozenset(
+    {"state", "textvariable", "text", "compound", "underline", "justify", "anchor", "font"}
+)
+# Button options that change the alternate's padding or size.
+_GEOMETRY_OPTION_KEYS = frozenset({"padding", "width", "height"})
+
+# Each Tk root binds one module-level <<ThemeChanged>> dispatcher that fans out to the live
+# adapters, so the binding never keeps an adapter alive and dead ones stop hearing events.
+_theme_listeners: "WeakSet[ThemeAdapter]" = WeakSet()
+_theme_bound_roots: "WeakSet[tk.Misc]" = WeakSet()
+
+
+def _dispatch_theme_change(event: Optional[tk.Event] = None) -> None:
+    for adapter in list(_theme_listeners):
+        adapter._handle_theme_change(event)
+
 
 class ThemeAdapter:
     """Bridge EDMC's theme helper with plain Tk widgets."""
 
+    __slots__ = (
+        "_theme",
+        "_config",
+        "_config_str_getter",
+        "_config_int_getter",
+        "_known_theme_ids",
+        "_lookup_cache",
+        "_stripe_cache",
+        "_class_options",
+        "_plain_widgets",
+        "_buttons",
+        "_checkbuttons",
+        "_alternate_buttons",
+        "_alternate_masters",
+        "_alternate_images",
+        "_wrapped_buttons",
+        "_idle_root",
+        "_theme_sync_pending",
+        "_button_defaults",
+        "_checkbox_defaults",
+        "_applied_options",
+        "_padding_cache",
+        "_widget_classes",
+        "_text_vars",
+        "_painted_alternates",
+        "_pending_refresh",
+        "_refresh_scheduled",
+        "_restyle_pending",
+        "_bulk_restyle_active",
+        "_activation_check_pending",
+        "_alternate_palette_cache",
+        "_alternate_palette_source",
+        "_dark_button_options_cache",
+        "_dark_button_options_source",
+        "_checkbox_options_cache",
+        "_theme_color_cache",
+        "_theme_color_source",
+        "_dark_button_style_configured",
+        "_dark_button_style",
+        "_is_dark_theme",
+        "_highlight_text",
+        "_table_fg_fallback",
+        "_theme_dirty",
+        "_last_theme_active",
+        "_dark_text",
+        "_dark_text_loaded",
+        "_fallback_panel_bg",
+        "_fallback_text_fg",
+        "_fallback_table_bg",
+        "_fallback_table_stripe",
+        "_fallback_table_header_bg",
+        "_fallback_table_header_fg",
+        "_fallback_table_header_hover",
+        "_fallback_button_bg",
+        "_fallback_button_fg",
+        "_fallback_button_active",
+        "_fallback_button_border",
+        "_fallback_link_fg",
+        "__weakref__",
+    )
+
+    # (alternate option, EDMC palette key, fallback attribute)
+    _ALT_OPTION_MAP: tuple[tuple[str, str, str], ...] = (
+        ("background", "background", "_fallback_panel_bg"),
+        ("activebackground", "activebackground", "_fallback_button_active"),
+        ("highlightbackground", "background", "_fallback_panel_bg"),
+        ("highlightcolor", "highlight", "_fallback_button_border"),
+    )
+
+    _LIGHT_PALETTE: Dict[str, str] = {
+        "_fallback_panel_bg": "#0d0d0d",
+        "_fallback_text_fg": "#f4bb60",
+        "_fallback_table_bg": "#19100a",
+        "_fallback_table_stripe": "#23160d",
+        "_fallback_table_header_bg": "#3b2514",
+        "_fallback_table_header_fg": "#f6e3c0",
+        "_fallback_table_header_hover": "#4a2f19",
+        "_fallback_button_bg": "#f19a29",
+        "_fallback_button_fg": "#1a1005",
+        "_fallback_button_active": "#ffb84a",
+        "_fallback_button_border": "#ffc266",
+        "_fallback_link_fg": "#0645ad",
+    }
+    # Text and header foregrounds come from EDMC's configured dark_text colour.
+    _DARK_PALETTE_BASE: Dict[str, str] = {
+        "_fallback_panel_bg": "#000000",
+        "_fallback_table_bg": "#000000",
+        "_fallback_table_stripe": "#121212",
+        "_fallback_table_header_bg": "#000000",
+        "_fallback_table_header_hover": "#1a1a1a",
+        "_fallback_button_bg": "#f19a29",
+        "_fallback_button_fg": "#1a1005",
+        "_fallback_button_active": "#ffb84a",
+        "_fallback_button_border": "#ffc266",
+        "_fallback_link_fg": "#268bd2",
+    }
+
+    _STYLE: ClassVar[Optional[ttk.Style]] = None
+    _dark_style_signature: ClassVar[Optional[tuple[Any, ...]]] = None
+
     def __init__(self) -> None:
-        self._style = ttk.Style()
+        _load_edmc_modules()
         self._theme = edmc_theme
         self._config = edmc_config
-        self._registered_widgets: "WeakSet[tk.Widget]" = WeakSet()
+        self._config_str_getter = self._resolve_config_getter("get_str")
+        self._config_int_getter = self._resolve_config_getter("get_int")
+        self._known_theme_ids = self._resolve_known_theme_ids()
+        self._lookup_cache: Dict[tuple[str, str], Optional[str]] = {}
+        self._stripe_cache: Dict[tuple[str, bool], str] = {}
+        # Options each Tk widget class accepts, read once from configure() per class.
+        self._class_options: Dict[str, frozenset[str]] = {}
+        self._plain_widgets: "WeakSet[tk.Widget]" = WeakSet()
         self._buttons: "WeakSet[tk.Widget]" = WeakSet()
-        self._checkbuttons: "WeakSet[tk.Widget]" = WeakSet()
-        self._alternate_buttons: Dict[tk.Widget, tk.Widget] = {}
+        self._checkbuttons: "WeakSet[tk.Checkbutton]" = WeakSet()
+        self._alternate_buttons: "WeakKeyDictionary[tk.Widget, tk.Widget]" = WeakKeyDictionary()
+        self._alternate_masters: "WeakKeyDictionary[tk.Widget, tk.Widget]" = WeakKeyDictionary()
+        # Keeps each alternate's PhotoImage referenced for as long as the label lives.
+        self._alternate_images: "WeakKeyDictionary[tk.Widget, Any]" = WeakKeyDictionary()
+        self._wrapped_buttons: "WeakSet[tk.Widget]" = WeakSet()
+        # Root window holding the application-wide <<ThemeChanged>> binding and idle callbacks.
+        self._idle_root: "Optional[weakref.ref[tk.Misc]]" = None
+        self._theme_sync_pending = False
+        self._button_defaults: "WeakKeyDictionary[tk.Widget, Dict[str, Any]]" = WeakKeyDictionary()
+        self._checkbox_defaults: "WeakKeyDictionary[tk.Widget, Dict[str, Any]]" = WeakKeyDictionary()
+        self._applied_options: "WeakKeyDictionary[tk.Widget, Dict[str, Any]]" = WeakKeyDictionary()
+        self._padding_cache: "WeakKeyDictionary[tk.Widget, tuple[Any, tuple[int, int]]]" = WeakKeyDictionary()
+        self._widget_classes: "WeakKeyDictionary[tk.Widget, str]" = WeakKeyDictionary()
+        # Text shared by a button and its alternate; held here so Tk keeps the variable.
+        self._text_vars: "WeakKeyDictionary[tk.Widget, tk.StringVar]" = WeakKeyDictionary()
+        self._painted_alternates: "WeakKeyDictionary[tk.Widget, Dict[str, Any]]" = WeakKeyDictionary()
+        # Insertion-ordered set of weak references so queued widgets can still be collected.
+        self._pending_refresh: "Dict[weakref.ref[tk.Widget], None]" = {}
+        self._refresh_scheduled = False
+        self._restyle_pending = False
+        self._bulk_restyle_active = False
+        self._activation_check_pending = False
+        self._alternate_palette_cache: Optional[Dict[str, Any]] = None
+        self._alternate_palette_source: Optional[Dict[str, Any]] = None
+        self._dark_button_options_cache: Optional[Dict[str, Any]] = None
+        self._dark_button_options_source: Optional[Dict[str, Any]] = None
+        self._checkbox_options_cache: Optional[Dict[str, Any]] = None
+        self._theme_color_cache: Dict[str, Optional[str]] = {}
+        self._theme_color_source: Optional[Dict[str, Any]] = None
+        self._dark_button_style_configured = False
         self._dark_button_style = "EDMCMA.Dark.TButton"
 
         self._is_dark_theme = False
-        self._apply_palette(False)
+        self._highlight_text = "#ffffff"
+        self._table_fg_fallback = "SystemWindowText"
+        self._theme_dirty = True
+        self._last_theme_active: Any = None
+        self._dark_text: Optional[str] = None
+        self._dark_text_loaded = False
+        # The forced sync applies the detected palette, so there is no separate light pass first.
         self._ensure_theme_latest(force=True)
 
+    @property
+    def _style(self) -> ttk.Style:
+        # Created on first use so light-theme adapters don't touch Tk before a lookup needs it.
+        return self._shared_style()
+
+    @classmethod
+    def _shared_style(cls) -> ttk.Style:
+        if cls._STYLE is None:
+            cls._STYLE = ttk.Style()
+        return cls._STYLE
+
     # ------------------------------------------------------------------
     # Theme detection / sync
     # ------------------------------------------------------------------
@@ -58,26 +274,99 @@ class ThemeAdapter:
         return self._is_dark_theme
 
     def _ensure_theme_latest(self, *, force: bool = False) -> None:
-        is_dark = self._detect_dark_theme()
+        # Between <<ThemeChanged>> events the answer cannot change, so skip the probe.
+        active = self._theme_active()
+        if not force and not self._theme_dirty and active == self._last_theme_active:
+            return
+        self._theme_dirty = False
+        self._last_theme_active = active
+        self._dark_text_loaded = False
+        self._invalidate_palette_caches()
+        is_dark = self._detect_dark_theme(active)
         if not force and is_dark == self._is_dark_theme:
             return
 
         self._apply_palette(is_dark)
         self._is_dark_theme = is_dark
+        self._refresh_theme_derived()
+        self._schedule_full_restyle()
+
+    def _refresh_theme_derived(self) -> None:
+        """Recompute values that depend only on the light/dark state."""
+        self._highlight_text = "#000000" if self._is_dark_theme else "#ffffff"
+        self._table_fg_fallback = (
+            self._fallback_table_header_fg if self._is_dark_theme else "SystemWindowText"
+        )
 
-        self._restyle_registered_widgets()
-        self._restyle_buttons()
-        self._restyle_checkbuttons()
-        self._update_button_alternate_visibility()
-        if self._is_dark_theme:
-            self._refresh_alternate_palettes()
-            self._schedule_alternate_palette_refresh()
+    def _schedule_full_restyle(self) -> None:
+        """Coalesce restyle passes requested within one Tk tick into a single idle drain."""
+        if self._restyle_pending:
+            return
+        anchor = self._idle_root() if self._idle_root is not None else None
+        if anchor is not None and self._call_when_idle(anchor, self._flush_full_restyle):
+            self._restyle_pending = True
+            return
+        self._restyle_all()
 
-    def _get_config_str(self, key: str) -> Optional[str]:
+    def _flush_full_restyle(self) -> None:
+        self._restyle_pending = False
+        self._restyle_all()
+
+    def _restyle_all(self) -> None:
+        # Queue theme.update() calls during the pass and flush them together afterwards.
+        self._bulk_restyle_active = True
+        try:
+            self._restyle_registered_widgets()
+            self._restyle_buttons()
+            self._restyle_checkbuttons()
+            # Also repaints visible alternates; their queued theme.update re-applies it afterwards.
+            self._update_button_alternate_visibility()
+        finally:
+            self._bulk_restyle_active = False
+        self._schedule_pending_refresh()
+
+    def _theme_active(self) -> Any:
+        if self._theme is None:
+            return None
+        return getattr(self._theme, "active", None)
+
+    def _handle_theme_change(self, _event: Optional[tk.Event] = None) -> None:
+        # ttk broadcasts <<ThemeChanged>> to every widget starting at the root, so the
+        # first delivery syncs and the rest of the burst is ignored until idle. Style values
+        # can change without a light/dark flip, so cached lookups are dropped on every
+        # delivery and re-read on demand.
+        self._lookup_cache.clear()
+        if self._theme_sync_pending:
+            return
+        self._theme_dirty = True
+        self._ensure_theme_latest()
+        root = self._idle_root() if self._idle_root is not None else None
+        if root is not None and self._call_when_idle(root, self._end_theme_sync_burst):
+            self._theme_sync_pending = True
+
+    def _end_theme_sync_burst(self) -> None:
+        self._theme_sync_pending = False
+
+    def _resolve_known_theme_ids(self) -> frozenset[int]:
+        if self._theme is None:
+            return frozenset()
+        return frozenset(
+            (
+                getattr(self._theme, "THEME_DEFAULT", 0),
+                getattr(self._theme, "THEME_DARK", 1),
+                getattr(self._theme, "THEME_TRANSPARENT", 2),
+            )
+        )
+
+    def _resolve_config_getter(self, name: str) -> Optional[Callable[..., Any]]:
         if self._config is None:
             return None
-        getter = getattr(self._config, "get_str", None)
-        if not callable(getter):
+        getter = getattr(self._config, name, None)
+        return getter if callable(getter) else None
+
+    def _get_config_str(self, key: str) -> Optional[str]:
+        getter = self._config_str_getter
+        if getter is None:
             return None
         try:
             value = getter(key, "")
@@ -88,10 +377,8 @@ class ThemeAdapter:
         return value or None
 
     def _get_config_int(self, key: str) -> Optional[int]:
-        if self._config is None:
-            return None
-        getter = getattr(self._config, "get_int", None)
-        if callable(getter):
+        getter = self._config_int_getter
+        if getter is not None:
             try:
                 value = getter(key, None)
             except Exception:
@@ -109,54 +396,41 @@ class ThemeAdapter:
         except ValueError:
             return None
 
-    def _detect_dark_theme(self) -> bool:
-        if self._theme is not None:
-            active = getattr(self._theme, "active", None)
-            if isinstance(active, int):
-                if active in (1, 2):
-                    return True
-                if active == 0:
-                    return False
-        if self._config is None:
-            return self._is_dark_theme
+    def _detect_dark_theme(self, active: Any = None) -> bool:
+        if isinstance(active, int):
+            if active in (1, 2):
+                return True
+            if active == 0:
+                return False
         value = self._get_config_int("theme")
         if value is not None:
             return value == 1
         return self._is_dark_theme
 
+    def _invalidate_palette_caches(self) -> None:
+        self._lookup_cache.clear()
+        self._stripe_cache.clear()
+        self._alternate_palette_cache = None
+        self._dark_button_options_cache = None
+        self._checkbox_options_cache = None
+        self._theme_color_cache.clear()
+        self._dark_button_style_configured = False
+
     def _apply_palette(self, is_dark: bool) -> None:
+        self._invalidate_palette_caches()
         if is_dark:
             dark_text = self._resolve_dark_text()
-            self._fallback_panel_bg = "#000000"
+            for name, value in self._DARK_PALETTE_BASE.items():
+                setattr(self, name, value)
             self._fallback_text_fg = dark_text
-            self._fallback_table_bg = "#000000"
-            self._fallback_table_stripe = "#121212"
-            self._fallback_table_header_bg = "#000000"
             self._fallback_table_header_fg = dark_text
-            self._fallback_table_header_hover = "#1a1a1a"
-            self._fallback_button_bg = "#f19a29"
-            self._fallback_button_fg = "#1a1005"
-            self._fallback_button_active = "#ffb84a"
-            self._fallback_button_border = "#ffc266"
-            self._fallback_link_fg = "#268bd2"
             self._configure_dark_button_style()
         else:
-            self._fallback_panel_bg = "#0d0d0d"
-            self._fallback_text_fg = "#f4bb60"
-            self._fallback_table_bg = "#19100a"
-            self._fallback_table_stripe = "#23160d"
-            self._fallback_table_header_bg = "#3b2514"
-            self._fallback_table_header_fg = "#f6e3c0"
-            self._fallback_table_header_hover = "#4a2f19"
-            self._fallback_button_bg = "#f19a29"
-            self._fallback_button_fg = "#1a1005"
-            self._fallback_button_active = "#ffb84a"
-            self._fallback_button_border = "#ffc266"
-            self._fallback_link_fg = "#0645ad"
+            for name, value in self._LIGHT_PALETTE.items():
+                setattr(self, name, value)
 
     def _resolve_dark_text(self) -> str:
-        value = self._get_config_str("dark_text")
-        return value or "#f5f5f5"
+        return self._get_config_dark_text() or "#f5f5f5"
 
     # ------------------------------------------------------------------
     # Registration helpers
@@ -171,56 +445,71 @@ class ThemeAdapter:
             except Exception:
                 pass
 
-        self._registered_widgets.add(widget)
-        if isinstance(widget, (tk.Button, ttk.Button, tk.Checkbutton, ttk.Checkbutton)):
+        # Buttons and checkbuttons are restyled through their own registries.
+        if isinstance(widget, _BUTTON_LIKE_TYPES):
             return
+        self._plain_widgets.add(widget)
         self._apply_widget_style(widget)
 
     def _restyle_registered_widgets(self) -> None:
-        for widget in list(self._registered_widgets):
+        stale = []
+        for widget in self._plain_widgets:
             if not self._widget_exists(widget):
-                self._registered_widgets.discard(widget)
-                continue
-            if widget in self._buttons:
-                continue
-            if isinstance(widget, (tk.Button, ttk.Button, tk.Checkbutton, ttk.Checkbutton)):
+                stale.append(widget)
                 continue
             self._apply_widget_style(widget)
+        for widget in stale:
+            self._plain_widgets.discard(widget)
 
     # ------------------------------------------------------------------
     # Styling primitives
     # ------------------------------------------------------------------
     def _apply_widget_style(self, widget: tk.Widget) -> None:
-        background = self.get_background_color(widget)
-        try:
-            widget.configure(background=background)
-        except tk.TclError:
-            pass
-        for option in ("fg", "foreground"):
+        style_name = self._widget_class(widget)
+        keys = _WIDGET_STYLE_KEYS & self._supported_options(widget, style_name)
+        if not keys:
+            return
+        options: Dict[str, Any] = {}
+        if "background" in keys:
+            options["background"] = self._background_for(widget, style_name)
+        if "foreground" in keys:
+            options["foreground"] = self.default_text_color()
+        self._configure_safe(widget, **options)
+
+    def _supported_options(self, widget: tk.Widget, style_name: Optional[str] = None) -> frozenset[str]:
+        if style_name is None:
+            style_name = self._widget_class(widget)
+        supported = self._class_options.get(style_name)
+        if supported is None:
             try:
-                widget.configure(**{option: self.default_text_color()})
-                break
+                supported = frozenset(widget.configure() or ())
             except tk.TclError:
-                continue
+                return frozenset()
+            self._class_options[style_name] = supported
+        return supported
 
     def default_text_color(self) -> str:
         if not self._is_dark_theme:
-            try:
-                value = self._style.lookup("TLabel", "foreground")
-            except tk.TclError:
-                value = None
+            value = self._cached_lookup("TLabel", "foreground")
             if value:
                 return value
             return "SystemWindowText"
         return self._fallback_text_fg
 
     def get_background_color(self, widget: tk.Widget) -> str:
-        style_name = widget.winfo_class()
+        return self._background_for(widget, self._widget_class(widget))
+
+    def _widget_class(self, widget: tk.Widget) -> str:
+        # A widget's Tk class is fixed at creation, so ask Tcl only once.
+        cached = self._widget_classes.get(widget)
+        if cached is None:
+            cached = widget.winfo_class()
+            self._widget_classes[widget] = cached
+        return cached
+
+    def _background_for(self, widget: tk.Widget, style_name: str) -> str:
         for option in ("background", "fieldbackground"):
-            try:
-                color = self._style.lookup(style_name, option)
-            except tk.TclError:
-                color = None
+            color = self._cached_lookup(style_name, option)
             if color:
                 return color
         try:
@@ -237,6 +526,7 @@ class ThemeAdapter:
     def style_button(self, button: tk.Widget) -> None:
         self.register(button)
         self._remember_button_defaults(button)
+        self._plain_widgets.discard(button)
         self._buttons.add(button)
         self._bind_theme_listener(button)
         if self._theme is not None:
@@ -251,11 +541,11 @@ class ThemeAdapter:
 
     def style_checkbox(self, checkbox: tk.Widget) -> None:
         self.register(checkbox)
-        self._checkbuttons.add(checkbox)
-
+        # Only classic Tk checkbuttons need adjusting; ttk ones follow their style.
         if isinstance(checkbox, tk.Checkbutton):
+            self._checkbuttons.add(checkbox)
             self._remember_checkbox_defaults(checkbox)
-            checkbox.bind("<<ThemeChanged>>", lambda _e, cb=checkbox: self._apply_checkbox_adjustments(cb), add="+")
+            checkbox.bind("<<ThemeChanged>>", self._handle_checkbox_theme_change, add="+")
             self._apply_checkbox_adjustments(checkbox)
 
     def enable_dark_theme_alternate(
@@ -289,6 +579,7 @@ class ThemeAdapter:
             highlightthickness=0,
             relief=tk.FLAT,
         )
+        self._share_button_text(button)
         self._synchronize_button_content(button, alternate, image=image)
         self._copy_geometry_attributes(button, alternate)
         self._sync_button_state(button, alternate)
@@ -304,32 +595,63 @@ class ThemeAdapter:
             pass
         self._bind_theme_listener(alternate)
         self._theme.register_alternate((button, alternate, alternate), dict(geometry))
-        setattr(alternate, "_edmcma_theme_master", button)
         self._register_alternate_relationship(button, alternate)
         self._clone_existing_tooltips(button, alternate)
 
-        self._alternate_buttons[button] = alternate
+        self._track_alternate(button, alternate)
         self._wrap_button_configure(button)
         self._schedule_theme_refresh(alternate)
         self._schedule_theme_refresh(button)
         self._schedule_theme_activation_check(button)
-        image_arg: Any = image if image is not None else getattr(alternate, "_edmcma_button_image", None)
+        image_arg: Any = image if image is not None else self._alternate_images.get(alternate)
         if image_arg is not None and not hasattr(image_arg, "configure"):
             image_arg = None
-        self._theme.button_bind(alternate, lambda _evt, btn=button: self._invoke_button(btn), image=image_arg)
+        self._theme.button_bind(alternate, self._invoke_alternate_master, image=image_arg)
         self._update_button_alternate_visibility()
 
-    def set_button_text(self, button: tk.Widget, text: str) -> None:
+    def _track_alternate(self, button: tk.Widget, alternate: tk.Widget) -> None:
+        # The two mappings keep each other's keys alive, so <Destroy> is what expires them.
+        self._alternate_buttons[button] = alternate
+        self._alternate_masters[alternate] = button
+        for widget in (button, alternate):
+            try:
+                widget.bind("<Destroy>", self._forget_alternate, add="+")
+            except tk.TclError:
+                continue
+
+    def _forget_alternate(self, event: tk.Event) -> None:
+        widget = getattr(event, "widget", None)
+        # Tk reports widgets it cannot map back to Python as path strings, which
+        # cannot be weakly referenced.
+        if not isinstance(widget, tk.Misc):
+            return
+        master = self._alternate_masters.pop(widget, None)
+        button = master if master is not None else widget
+        alternate = self._alternate_buttons.pop(button, None)
+        if alternate is not None:
+            self._alternate_masters.pop(alternate, None)
+            self._alternate_images.pop(alternate, None)
+
+    def _share_button_text(self, button: tk.Widget) -> None:
+        if button in self._text_vars or self._safe_cget(button, "textvariable"):
+            return
         try:
-            button.configure(text=text)
-        except tk.TclError:
-            pass
+            variable = tk.StringVar(master=button, value=str(self._safe_cget(button, "text") or ""))
+            button.configure(textvariable=variable)
+        except (tk.TclError, RuntimeError):
+            return
+        self._text_vars[button] = variable
+
+    def set_button_text(self, button: tk.Widget, text: str) -> None:
+        variable = self._text_vars.get(button)
+        if variable is not None:
+            # Button and alternate both display the variable, so one set updates both.
+            variable.set(text)
+            return
+        self._configure_safe(button, text=text)
         alternate = self._alternate_buttons.get(button)
         if alternate is not None:
-            try:
-                alternate.configure(text=text)
-            except tk.TclError:
-                pass
+            self._configure_changed(alternate, {"text": text})
             self._copy_geometry_attributes(button, alternate)
             self._schedule_theme_refresh(alternate)
 
@@ -340,92 +662,97 @@ class ThemeAdapter:
     # Internal styling plumbing
     # ------------------------------------------------------------------
     def _apply_button_style(self, button: tk.Widget) -> None:
-        if not self._widget_exists(button):
+        # Callers hold a live button: style_button was just handed it and restyles check first.
+        if self._is_dark_theme:
+            self._apply_dark_button_style(button)
             return
-        try:
-            if self._is_dark_theme:
-                self._apply_dark_button_style(button)
-            else:
-                defaults: dict[str, Any] | None = getattr(button, "_edmcma_button_defaults", None)
-                if defaults:
-                    self._apply_widget_options(button, defaults)
-                else:
-                    button.configure(
-                        background="SystemButtonFace",
-                        foreground="#000000",
-                        activebackground="#e6e6e6",
-                        activeforeground="#000000",
-                        relief=tk.RAISED,
-                        bd=2,
-                        highlightthickness=0,
-                    )
-                button.configure(padding=(12, 4))
-        except tk.TclError:
-            pass
+        defaults = self._button_defaults.get(button)
+        if defaults:
+            self._apply_widget_options(button, defaults)
+        elif not self._configure_safe(
+            button,
+            background="SystemButtonFace",
+            foreground="#000000",
+            activebackground="#e6e6e6",
+            activeforeground="#000000",
+            relief=tk.RAISED,
+            bd=2,
+            highlightthickness=0,
+        ):
+            return
+        self._configure_safe(button, padding=(12, 4))
 
     def _apply_checkbox_style(self, checkbox: tk.Checkbutton) -> None:
         if not self._widget_exists(checkbox):
             return
-        try:
-            if self._is_dark_theme:
-                background = self.panel_background_color()
-                checkbox.configure(
-                    background=background,
-                    activebackground=background,
-                    selectcolor=background,
-                    highlightbackground=background,
-                    highlightcolor=background,
-                    highlightthickness=0,
-                    bd=0,
-                    relief=tk.FLAT,
-                    indicatoron=True,
-                )
-            else:
-                default_bg = self._style.lookup("TCheckbutton", "background") or "SystemButtonFace"
-                checkbox.configure(
-                    background=default_bg,
-                    activebackground=default_bg,
-                    selectcolor=default_bg,
-                    highlightbackground=default_bg,
-                    highlightcolor=default_bg,
-                    highlightthickness=0,
-                    bd=0,
-                    relief=tk.FLAT,
-                    indicatoron=True,
-                )
-        except tk.TclError:
-            pass
+        self._configure_safe(checkbox, **self._checkbox_style_options())
 
     def _apply_dark_button_style(self, button: tk.Widget) -> None:
         if isinstance(button, ttk.Button):
             self._configure_dark_button_style()
-            try:
-                button.configure(style=self._dark_button_style, padding=(12, 4))
-            except tk.TclError:
-                pass
+            self._configure_safe(button, style=self._dark_button_style, padding=(12, 4))
+            return
+        self._configure_safe(button, **self._dark_button_options())
+
+    def _checkbox_style_options(self) -> Dict[str, Any]:
+        cached = self._checkbox_options_cache
+        if cached is not None:
+            return cached
+        if self._is_dark_theme:
+            background = self._fallback_panel_bg
         else:
-            try:
-                button.configure(
-                    background=self.button_background_color(),
-                    foreground=self.button_foreground_color(),
-                    activebackground=self.button_active_background_color(),
-                    activeforeground=self.button_foreground_color(),
-                    highlightthickness=1,
-                    highlightbackground=self.button_border_color(),
-                    highlightcolor=self.button_border_color(),
-                    bd=0,
-                    relief=tk.FLAT,
-                    padx=12,
-                    pady=4,
-                )
-            except tk.TclError:
-                pass
+            background = self._cached_lookup("TCheckbutton", "background") or "SystemButtonFace"
+        options: Dict[str, Any] = {
+            "background": background,
+            "activebackground": background,
+            "selectcolor": background,
+            "highlightbackground": background,
+            "highlightcolor": background,
+            "highlightthickness": 0,
+            "bd": 0,
+            "relief": tk.FLAT,
+            "indicatoron": True,
+        }
+        self._checkbox_options_cache = options
+        return options
+
+    def _dark_button_options(self) -> Dict[str, Any]:
+        # The foreground follows EDMC's theme.current, which is replaced on re-apply.
+        palette = self._theme_palette()
+        cached = self._dark_button_options_cache
+        if cached is not None and palette is self._dark_button_options_source:
+            return cached
+        foreground = self.button_foreground_color()
+        border = self._fallback_button_border
+        options: Dict[str, Any] = {
+            "background": self._fallback_button_bg,
+            "foreground": foreground,
+            "activebackground": self._fallback_button_active,
+            "activeforeground": foreground,
+            "highlightthickness": 1,
+            "highlightbackground": border,
+            "highlightcolor": border,
+            "bd": 0,
+            "relief": tk.FLAT,
+            "padx": 12,
+            "pady": 4,
+        }
+        self._dark_button_options_cache = options
+        self._dark_button_options_source = palette
+        return options
 
     def _configure_dark_button_style(self) -> None:
-        bg = self.button_background_color()
+        if self._dark_button_style_configured:
+            return
+        bg = self._fallback_button_bg
         fg = self.button_foreground_color()
-        active_bg = self.button_active_background_color()
-        border = self.button_border_color()
+        active_bg = self._fallback_button_active
+        border = self._fallback_button_border
+        # The ttk style is process-wide, so adapters sharing it skip identical reconfigures.
+        signature = (id(self._style), bg, fg, active_bg, border)
+        if ThemeAdapter._dark_style_signature == signature:
+            self._dark_button_style_configured = True
+            return
         try:
             self._style.configure(
                 self._dark_button_style,
@@ -443,20 +770,16 @@ class ThemeAdapter:
                 bordercolor=[("focus", border), ("active", border)],
             )
         except tk.TclError:
-            pass
+            return
+        ThemeAdapter._dark_style_signature = signature
+        self._dark_button_style_configured = True
 
     # ------------------------------------------------------------------
     # Alternate management
     # ------------------------------------------------------------------
     def _update_button_alternate_visibility(self) -> None:
-        for button, alternate in list(self._alternate_buttons.items()):
-            if not self._widget_exists(button):
-                self._alternate_buttons.pop(button, None)
-                continue
-            if not self._widget_exists(alternate):
-                self._alternate_buttons.pop(button, None)
-                continue
-
+        # Entries only leave through <Destroy>, so the mapping can be walked in place.
+        for button, alternate in self._alternate_buttons.items():
             if self._is_dark_theme:
                 # Show alternate label, hide ttk button.
                 try:
@@ -484,43 +807,17 @@ class ThemeAdapter:
                     pass
                 self._schedule_theme_refresh(button)
 
-    def _refresh_alternate_palettes(self) -> None:
-        for alternate in list(self._alternate_buttons.values()):
-            if not self._widget_exists(alternate):
-                continue
-            self._apply_alternate_palette(alternate)
-
-    def _schedule_alternate_palette_refresh(self) -> None:
-        for alternate in list(self._alternate_buttons.values()):
-            if not self._widget_exists(alternate):
-                continue
-            try:
-                alternate.after_idle(lambda widget=alternate: self._apply_alternate_palette(widget))
-            except tk.TclError:
-                self._apply_alternate_palette(alternate)
-
     def _copy_geometry_attributes(self, source: tk.Widget, target: tk.Widget) -> None:
         pad_x, pad_y = self._extract_padding(source)
-        try:
-            target.configure(padx=pad_x, pady=pad_y)
-        except tk.TclError:
-            pass
-        try:
-            font = source.cget("font")
-            if font not in ("", None):
-                target.configure(font=font)
-        except tk.TclError:
-            pass
+        options: Dict[str, Any] = {"padx": pad_x, "pady": pad_y}
+        font = self._safe_cget(source, "font")
+        if font not in ("", None):
+            options["font"] = font
         for option in ("width", "height"):
-            try:
-                value = source.cget(option)
-            except tk.TclError:
-                continue
+            value = self._safe_cget(source, option)
             if isinstance(value, (int, float)) and value > 0:
-                try:
-                    target.configure(**{option: value})
-                except tk.TclError:
-                    continue
+                options[option] = value
+        self._configure_changed(target, options)
 
     def _synchronize_button_content(
         self,
@@ -529,55 +826,45 @@ class ThemeAdapter:
         *,
         image: Optional[tk.PhotoImage] = None,
     ) -> None:
+        options: Dict[str, Any] = {}
         textvariable = self._safe_cget(button, "textvariable")
         if textvariable:
-            try:
-                alternate.configure(textvariable=textvariable)
-            except tk.TclError:
-                pass
+            options["textvariable"] = textvariable
         else:
             text = self._safe_cget(button, "text")
             if text not in (None, ""):
-                try:
-                    alternate.configure(text=text)
-                except tk.TclError:
-                    pass
+                options["text"] = text
 
         image_to_use: Any = image if image is not None else self._safe_cget(button, "image")
         if image_to_use not in (None, "", 0):
-            try:
-                alternate.configure(image=image_to_use)
-            except tk.TclError:
-                pass
-            setattr(alternate, "_edmcma_button_image", image_to_use)
+            options["image"] = image_to_use
+            self._alternate_images[alternate] = image_to_use
         else:
-            try:
-                alternate.configure(image="")
-            except tk.TclError:
-                pass
+            options["image"] = ""
 
-        for option in ("compound", "underline", "justify", "anchor"):
+        for option in ("compound", "underline", "justify", "anchor", "font"):
             value = self._safe_cget(button, option)
             if value not in (None, ""):
-                try:
-                    alternate.configure(**{option: value})
-                except tk.TclError:
-                    continue
-
-        font = self._safe_cget(button, "font")
-        if font not in (None, ""):
-            try:
-                alternate.configure(font=font)
-            except tk.TclError:
-                pass
+                options[option] = value
+
+        self._configure_changed(alternate, options)
+
+    def _configure_changed(self, widget: tk.Widget, options: Dict[str, Any]) -> None:
+        """Apply only the options that differ from what was last pushed to ``widget``."""
+        applied = self._applied_options.get(widget)
+        if applied is None:
+            applied = {}
+            self._applied_options[widget] = applied
+        changed = {key: value for key, value in options.items() if key not in applied or applied[key] != value}
+        if not changed:
+            return
+        self._apply_widget_options(widget, changed)
+        applied.update(changed)
 
     def _sync_button_state(self, button: tk.Widget, alternate: tk.Widget) -> None:
         state = self._safe_cget(button, "state")
         if state not in (None, ""):
-            try:
-                alternate.configure(state=state)
-            except tk.TclError:
-                pass
+            self._configure_changed(alternate, {"state": state})
 
     def _register_alternate_relationship(self, button: tk.Widget, alternate: tk.Widget) -> None:
         existing = list(getattr(button, "_edmcma_theme_alternates", ()))
@@ -596,50 +883,54 @@ class ThemeAdapter:
                     continue
 
     def _wrap_button_configure(self, button: tk.Widget) -> None:
-        if getattr(button, "_edmcma_configure_wrapped", None):
+        # Without EDMC's theme no alternate ever exists, so there is nothing to mirror.
+        if self._theme is None or button in self._wrapped_buttons:
             return
 
+        # Tk's config is an alias of configure, so one wrapper serves both names.
         original_configure = button.configure
-        original_config = button.config
 
         def _wrapped_configure(*args: Any, **kwargs: Any) -> Any:
-            options = self._extract_config_options(args, kwargs)
+            if not args and not kwargs:
+                return original_configure()
+            variable = self._text_vars.get(button)
+            if variable is not None:
+                # Tk ignores -text while the shared -textvariable is attached; route it there.
+                options = self._extract_config_options(args, kwargs)
+                if "text" in options:
+                    options = dict(options)
+                    variable.set(options.pop("text"))
+                    if not options:
+                        return None
+                    args, kwargs = (), options
             try:
                 result = original_configure(*args, **kwargs)
             except tk.TclError as exc:
+                options = self._extract_config_options(args, kwargs)
                 if self._should_swallow_config_error(button, options, exc):
                     self._log_ignored_option(button, options)
                     return None
                 raise
-            if options:
-                self._mirror_alternate_after_config(button, options)
-            return result
-
-        def _wrapped_config(*args: Any, **kwargs: Any) -> Any:
+            # Extraction no longer copies, and the mirror does the only alternate lookup.
             options = self._extract_config_options(args, kwargs)
-            try:
-                result = original_config(*args, **kwargs)
-            except tk.TclError as exc:
-                if self._should_swallow_config_error(button, options, exc):
-                    self._log_ignored_option(button, options)
-                    return None
-                raise
             if options:
                 self._mirror_alternate_after_config(button, options)
             return result
 
         button.configure = _wrapped_configure  # type: ignore[assignment]
-        button.config = _wrapped_config  # type: ignore[assignment]
-        setattr(button, "_edmcma_configure_wrapped", (original_configure, original_config))
+        button.config = _wrapped_configure  # type: ignore[assignment]
+        self._wrapped_buttons.add(button)
 
-    def _extract_config_options(self, args: tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _extract_config_options(args: tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # Callers only read the result, so the caller's mapping is returned as-is.
         if kwargs:
-            return dict(kwargs)
+            return kwargs
         if not args:
             return {}
         first = args[0]
         if isinstance(first, dict):
-            return dict(first)
+            return first
         if len(args) >= 2:
             return {str(first): args[1]}
         return {}
@@ -648,21 +939,23 @@ class ThemeAdapter:
         alternate = self._alternate_buttons.get(button)
         if alternate is None:
             return
-        if "state" in options:
-            try:
-                alternate.configure(state=options["state"])
-            except tk.TclError:
-                pass
-        if any(key in options for key in ("text", "textvariable", "image", "compound", "underline", "justify", "anchor")):
-            self._synchronize_button_content(button, alternate)
-        if any(key in options for key in ("padding", "width", "height", "font")):
-            self._copy_geometry_attributes(button, alternate)
-            font = self._safe_cget(button, "font")
-            if font not in (None, ""):
-                try:
-                    alternate.configure(font=font)
-                except tk.TclError:
-                    pass
+        # Mirror the values the caller just passed rather than re-reading them from Tk.
+        keys = options.keys()
+        mirrored: Dict[str, Any] = {key: options[key] for key in keys & _MIRRORED_OPTION_KEYS}
+        if "image" in options:
+            image = options["image"]
+            mirrored["image"] = image if image not in (None, 0) else ""
+            if mirrored["image"]:
+                self._alternate_images[alternate] = image
+        if keys & _GEOMETRY_OPTION_KEYS:
+            if "padding" in options:
+                mirrored["padx"], mirrored["pady"] = self._parse_padding(options["padding"])
+            for key in ("width", "height"):
+                value = options.get(key)
+                if isinstance(value, (int, float)) and value > 0:
+                    mirrored[key] = value
+        if mirrored:
+            self._configure_changed(alternate, mirrored)
         self._apply_alternate_palette(alternate)
         self._schedule_theme_refresh(alternate)
 
@@ -695,28 +988,37 @@ class ThemeAdapter:
 
 
     def _extract_padding(self, widget: tk.Widget) -> tuple[int, int]:
-        default = (12, 4)
         try:
             padding = widget.cget("padding")
         except tk.TclError:
-            return default
-        values: list[int] = []
-        if isinstance(padding, (list, tuple)):
-            for item in padding:
-                try:
-                    values.append(int(float(item)))
-                except (TypeError, ValueError):
-                    continue
-        elif isinstance(padding, str):
-            for part in padding.replace(",", " ").split():
-                try:
-                    values.append(int(float(part)))
-                except ValueError:
-                    continue
+            return _DEFAULT_PADDING
+        cached = self._padding_cache.get(widget)
+        if cached is not None and cached[0] == padding:
+            return cached[1]
+        parsed = self._parse_padding(padding)
+        self._padding_cache[widget] = (padding, parsed)
+        return parsed
+
+    @staticmethod
+    def _parse_padding(padding: Any) -> tuple[int, int]:
+        if isinstance(padding, str):
+            values = [int(part) for part in _PADDING_TOKEN_RE.findall(padding)[:2]]
+        elif isinstance(padding, (list, tuple)):
+            if len(padding) in (1, 2) and all(type(item) is int for item in padding):
+                values = list(padding)
+            else:
+                values = []
+                for item in padding:
+                    try:
+                        values.append(int(float(item)))
+                    except (TypeError, ValueError):
+                        continue
         elif isinstance(padding, (int, float)):
             values = [int(padding)]
+        else:
+            values = []
         if not values:
-            return default
+            return _DEFAULT_PADDING
         if len(values) == 1:
             return (values[0], values[0])
         return (values[0], values[1])
@@ -727,117 +1029,114 @@ class ThemeAdapter:
     def _schedule_theme_activation_check(self, widget: tk.Widget) -> None:
         if not self._theme or not self._widget_exists(widget):
             return
-        active = getattr(self._theme, "active", None)
-        if isinstance(active, int):
-            dark_id = getattr(self._theme, "THEME_DARK", 1)
-            transparent_id = getattr(self._theme, "THEME_TRANSPARENT", 2)
-            default_id = getattr(self._theme, "THEME_DEFAULT", 0)
-            if active in (dark_id, transparent_id, default_id):
-                self._ensure_theme_latest(force=True)
-                return
-
-        try:
-            widget.after(100, lambda w=widget: self._schedule_theme_activation_check(w))
-        except tk.TclError:
-            pass
-
-    def _apply_alternate_palette(self, alternate: tk.Widget) -> None:
-        if not self._is_dark_theme:
+        active = self._theme_active()
+        if isinstance(active, int) and active in self._known_theme_ids:
+            # A no-op unless theme.active moved since the last sync.
+            self._ensure_theme_latest()
             return
-        palette: Dict[str, Any] = {}
-        if self._theme is not None:
-            current = getattr(self._theme, "current", None)
-            if isinstance(current, dict):
-                palette = current
-
-        background = palette.get("background", self._fallback_panel_bg)
-        activebackground = palette.get("activebackground", self._fallback_button_active)
-        highlight = palette.get("highlight", self._fallback_button_border)
-
+        if self._activation_check_pending:
+            return
+        # EDMC may not have applied its theme yet: look once more shortly, then rely on <<ThemeChanged>>.
         try:
-            alternate.configure(
-                background=background,
-                activebackground=activebackground,
-                highlightbackground=background,
-                highlightcolor=highlight,
-            )
+            widget.nametowidget(".").after(100, self._run_activation_check)
         except tk.TclError:
-            pass
+            return
+        self._activation_check_pending = True
 
-        self._apply_alternate_text_colors(alternate, palette)
+    def _run_activation_check(self) -> None:
+        self._activation_check_pending = False
+        self._ensure_theme_latest()
 
-    def _apply_alternate_text_colors(
-        self,
-        alternate: tk.Widget,
-        palette: Optional[Dict[str, Any]] = None,
-    ) -> tuple[str, str, str]:
+    def _apply_alternate_palette(self, alternate: tk.Widget, *, force: bool = False) -> None:
         if not self._is_dark_theme:
-            return (self.button_foreground_color(),) * 3
-        if palette is None:
-            palette = {}
-            if self._theme is not None:
-                current = getattr(self._theme, "current", None)
-                if isinstance(current, dict):
-                    palette = current
-
-        previous = getattr(self, "_current_button", None)
-        setattr(self, "_current_button", alternate)
-        try:
-            foreground, activeforeground, disabledforeground = self._resolve_alternate_text_colors(palette)
-        finally:
-            setattr(self, "_current_button", previous)
-        for option, value in (
-            ("foreground", foreground),
-            ("activeforeground", activeforeground),
-            ("disabledforeground", disabledforeground),
-        ):
-            try:
-                alternate.configure(**{option: value})
-            except tk.TclError:
-                continue
-        return foreground, activeforeground, disabledforeground
-
-    def _resolve_alternate_text_colors(self, palette: Dict[str, Any]) -> tuple[str, str, str]:
-        fallback = self.button_foreground_color()
-
-        raw_foreground = palette.get("foreground")
-        if isinstance(raw_foreground, str) and raw_foreground.strip():
-            foreground = raw_foreground.strip()
-        else:
-            foreground = fallback
-        raw_active = palette.get("activeforeground")
-        if isinstance(raw_active, str) and raw_active.strip():
-            activeforeground = raw_active.strip()
-        else:
-            activeforeground = foreground
+            return
+        options = self._alternate_palette(self._theme_palette())
+        # The cached dict is rebuilt whenever the palette changes, so identity means "already painted".
+        if not force and self._painted_alternates.get(alternate) is options:
+            return
+        self._apply_widget_options(alternate, options)
+        self._painted_alternates[alternate] = options
 
-        raw_disabled = palette.get("disabledforeground")
-        if isinstance(raw_disabled, str) and raw_disabled.strip():
-            disabledforeground = raw_disabled.strip()
-        else:
-            disabledforeground = foreground
+    def _theme_palette(self) -> Optional[Dict[str, Any]]:
+        if self._theme is None:
+            return None
+        current = getattr(self._theme, "current", None)
+        return current if isinstance(current, dict) else None
+
+    def _alternate_palette(self, palette: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        # EDMC swaps in a new ``theme.current`` dict when it re-applies a theme.
+        cached = self._alternate_palette_cache
+        if cached is not None and palette is self._alternate_palette_source:
+            return cached
+        source = palette or {}
+        options = {
+            option: source.get(key, getattr(self, fallback_attr))
+            for option, key, fallback_attr in self._ALT_OPTION_MAP
+        }
+        (
+            options["foreground"],
+            options["activeforeground"],
+            options["disabledforeground"],
+        ) = self._resolve_alternate_text_colors(source)
+        self._alternate_palette_cache = options
+        self._alternate_palette_source = palette
+        return options
 
+    def _resolve_alternate_text_colors(self, palette: Dict[str, Any]) -> tuple[str, str, str]:
+        raw = palette.get("foreground")
+        # Only consult the configured colours when EDMC's palette has no foreground.
+        foreground = (raw.strip() if isinstance(raw, str) else "") or self.button_foreground_color()
+        raw = palette.get("activeforeground")
+        activeforeground = (raw.strip() if isinstance(raw, str) else "") or foreground
+        raw = palette.get("disabledforeground")
+        disabledforeground = (raw.strip() if isinstance(raw, str) else "") or foreground
         return foreground, activeforeground, disabledforeground
 
     def _apply_post_theme_update_adjustments(self, widget: tk.Widget) -> None:
-        if not self._is_dark_theme:
-            return
-        if getattr(widget, "_edmcma_theme_master", None) is None:
+        if not self._is_dark_theme or widget not in self._alternate_masters:
             return
-        self._apply_alternate_palette(widget)
+        # theme.update() has just repainted the widget with EDMC's own colours.
+        self._apply_alternate_palette(widget, force=True)
 
     def _current_theme_color(self, key: str) -> Optional[str]:
-        if self._theme is None:
-            return None
+        cache = self._theme_color_cache
         current = getattr(self._theme, "current", None)
-        if not isinstance(current, dict):
-            return None
+        # Same dict as last time: it already passed the type check, so go straight to the cache.
+        if current is None or current is not self._theme_color_source:
+            if not isinstance(current, dict):
+                return None
+            cache.clear()
+            self._theme_color_source = current
+        try:
+            return cache[key]
+        except KeyError:
+            pass
         value = current.get(key)
-        if isinstance(value, str):
-            stripped = value.strip()
-            if stripped:
-                return stripped
-        return None
+        color = (value.strip() or None) if isinstance(value, str) else None
+        cache[key] = color
+        return color
+
+    def _cached_lookup(self, style_name: str, option: str) -> Optional[str]:
+        key = (style_name, option)
+        try:
+            return self._lookup_cache[key]
+        except KeyError:
+            pass
+        try:
+            value = self._style.lookup(style_name, option) or None
+        except tk.TclError:
+            value = None
+        self._lookup_cache[key] = value
+        return value
+
+    @staticmethod
+    def _configure_safe(widget: tk.Widget, **options: Any) -> bool:
+        """Apply ``options`` in one configure call; report whether Tk accepted them."""
+        try:
+            widget.configure(**options)
+        except tk.TclError:
+            return False
+        return True
 
     def _safe_cget(self, widget: tk.Widget, option: str) -> Any:
         try:
@@ -845,92 +1144,116 @@ class ThemeAdapter:
         except tk.TclError:
             return None
 
+    def _call_when_idle(self, widget: tk.Widget, callback: Callable[[], None]) -> bool:
+        # Schedule on the root so the callback survives the anchor widget being destroyed.
+        try:
+            widget.nametowidget(".").after_idle(callback)
+        except tk.TclError:
+            return False
+        return True
+
     def _schedule_theme_refresh(self, widget: tk.Widget) -> None:
         if not self._theme:
             return
+        self._pending_refresh[weakref.ref(widget)] = None
+        if not self._bulk_restyle_active:
+            self._schedule_pending_refresh()
 
-        def _refresh() -> None:
-            if not self._widget_exists(widget):
-                return
+    def _schedule_pending_refresh(self) -> None:
+        if self._refresh_scheduled or not self._pending_refresh:
+            return
+        anchor = next(iter(self._pending_refresh))()
+        if anchor is not None and self._call_when_idle(anchor, self._drain_refresh):
+            self._refresh_scheduled = True
+        else:
+            self._drain_refresh()
+
+    def _drain_refresh(self) -> None:
+        self._refresh_scheduled = False
+        pending, self._pending_refresh = self._pending_refresh, {}
+        for ref in pending:
+            widget = ref()
+            if widget is None or not self._widget_exists(widget):
+                continue
             try:
                 self._theme.update(widget)
             except Exception:
-                pass
-            else:
-                self._apply_post_theme_update_adjustments(widget)
-
-        try:
-            widget.after_idle(_refresh)
-        except tk.TclError:
-            _refresh()
+                continue
+            self._apply_post_theme_update_adjustments(widget)
 
     def _bind_theme_listener(self, widget: tk.Widget) -> None:
-        if getattr(widget, "_edmcma_theme_listener", False):
+        # One binding on the "all" tag sees <<ThemeChanged>> for every widget.
+        if self._idle_root is not None and self._idle_root() is not None:
             return
-
-        def _handle_theme_change(_event: tk.Event) -> None:
-            self._ensure_theme_latest()
-
         try:
-            widget.bind("<<ThemeChanged>>", _handle_theme_change, add="+")
-            setattr(widget, "_edmcma_theme_listener", True)
-        except Exception:
-            pass
+            root = widget.nametowidget(".")
+            if root not in _theme_bound_roots:
+                root.bind_all("<<ThemeChanged>>", _dispatch_theme_change, add="+")
+                _theme_bound_roots.add(root)
+        except tk.TclError:
+            return
+        _theme_listeners.add(self)
+        self._idle_root = weakref.ref(root)
 
     def _restyle_buttons(self) -> None:
-        for button in list(self._buttons):
-            if not self._widget_exists(button):
-                self._buttons.discard(button)
+        stale = []
+        exists = self._widget_exists
+        restyle = self._schedule_theme_refresh if self._theme is not None else self._apply_button_style
+        for button in self._buttons:
+            if not exists(button):
+                stale.append(button)
                 continue
-            if self._theme is not None:
-                self._schedule_theme_refresh(button)
-            else:
-                self._apply_button_style(button)
+            restyle(button)
+        for button in stale:
+            self._buttons.discard(button)
 
     def _restyle_checkbuttons(self) -> None:
-        for checkbox in list(self._checkbuttons):
-            if not self._widget_exists(checkbox):
-                self._checkbuttons.discard(checkbox)
+        stale = []
+        exists = self._widget_exists
+        adjust = self._apply_checkbox_adjustments
+        for checkbox in self._checkbuttons:
+            if not exists(checkbox):
+                stale.append(checkbox)
                 continue
-            if isinstance(checkbox, tk.Checkbutton):
-                self._apply_checkbox_adjustments(checkbox)
+            adjust(checkbox)
+        for checkbox in stale:
+            self._checkbuttons.discard(checkbox)
 
     def _remember_button_defaults(self, button: tk.Widget) -> None:
-        if getattr(button, "_edmcma_button_defaults", None) is not None:
+        if button in self._button_defaults:
             return
-        snapshot: dict[str, Any] = {}
-        for option in (
-            "background",
-            "foreground",
-            "activebackground",
-            "activeforeground",
-            "highlightbackground",
-            "highlightcolor",
-            "highlightthickness",
-            "bd",
-            "relief",
-            "style",
-            "padding",
-        ):
-            try:
-                snapshot[option] = button.cget(option)
-            except tk.TclError:
-                continue
-        button._edmcma_button_defaults = snapshot  # type: ignore[attr-defined]
+        self._button_defaults[button] = self._snapshot_options(button, _BUTTON_DEFAULT_KEYS)
 
     def _remember_checkbox_defaults(self, checkbox: tk.Checkbutton) -> None:
-        if getattr(checkbox, "_edmcma_checkbox_defaults", None) is not None:
+        if checkbox in self._checkbox_defaults:
             return
-        snapshot: dict[str, Any] = {}
-        for option in ("highlightthickness", "highlightbackground", "highlightcolor", "bd", "selectcolor"):
-            try:
-                snapshot[option] = checkbox.cget(option)
-            except tk.TclError:
-                continue
-        checkbox._edmcma_checkbox_defaults = snapshot  # type: ignore[attr-defined]
+        self._checkbox_defaults[checkbox] = self._snapshot_options(checkbox, _CHECKBOX_DEFAULT_KEYS)
+
+    @staticmethod
+    def _snapshot_options(widget: tk.Widget, keys: tuple[str, ...]) -> Dict[str, Any]:
+        """Read ``keys`` from a single ``configure()`` query instead of one ``cget`` each."""
+        try:
+            current = widget.configure() or {}
+        except tk.TclError:
+            return {}
+        snapshot: Dict[str, Any] = {}
+        for key in keys:
+            entry = current.get(key)
+            if entry and len(entry) == 2:
+                # Synonyms such as bd report ("bd", "-borderwidth"); read the real option.
+                entry = current.get(str(entry[1]).lstrip("-"))
+            if entry:
+                snapshot[key] = entry[-1]
+        return snapshot
 
     @staticmethod
     def _apply_widget_options(widget: tk.Widget, options: dict[str, Any]) -> None:
+        """Configure ``options`` in one call, falling back per option to skip the ones Tk rejects."""
+        try:
+            widget.configure(**options)
+            return
+        except tk.TclError:
+            pass
         for option, value in options.items():
             try:
                 widget.configure(**{option: value})
@@ -938,24 +1261,29 @@ class ThemeAdapter:
                 continue
 
     def _apply_checkbox_adjustments(self, checkbox: tk.Checkbutton) -> None:
-        defaults: dict[str, Any] | None = getattr(checkbox, "_edmcma_checkbox_defaults", None)
+        defaults = self._checkbox_defaults.get(checkbox)
         if defaults is None:
             return
-        if self.is_dark_theme:
-            try:
-                checkbox.configure(highlightthickness=0, bd=0, selectcolor="black")
-            except tk.TclError:
-                pass
-        else:
-            restore: dict[str, Any] = {}
-            for option in ("highlightthickness", "bd", "highlightbackground", "highlightcolor", "selectcolor"):
-                if option in defaults:
-                    restore[option] = defaults[option]
-            if restore:
-                try:
-                    checkbox.configure(**restore)
-                except tk.TclError:
-                    pass
+        # Callers sync the theme first, so read the flag rather than re-entering the property.
+        if self._is_dark_theme:
+            self._configure_safe(checkbox, highlightthickness=0, bd=0, selectcolor="black")
+        elif defaults:
+            # The snapshot holds exactly the _CHECKBOX_DEFAULT_KEYS the widget reported.
+            self._configure_safe(checkbox, **defaults)
+
+    def _handle_checkbox_theme_change(self, event: tk.Event) -> None:
+        checkbox = getattr(event, "widget", None)
+        if isinstance(checkbox, tk.Checkbutton):
+            self._ensure_theme_latest()
+            self._apply_checkbox_adjustments(checkbox)
+
+    def _invoke_alternate_master(self, event: tk.Event) -> None:
+        widget = getattr(event, "widget", None)
+        if not isinstance(widget, tk.Misc):
+            return
+        button = self._alternate_masters.get(widget)
+        if button is not None:
+            self._invoke_button(button)
 
     def _invoke_button(self, button: tk.Widget) -> None:
         try:
@@ -963,7 +1291,7 @@ class ThemeAdapter:
             if callable(invoke):
                 invoke()
                 return
-        except Exception:
+        except tk.TclError:
             pass
         try:
             command = button.cget("command")
@@ -985,15 +1313,9 @@ class ThemeAdapter:
     # Button palette helpers
     # ------------------------------------------------------------------
     def table_background_color(self) -> str:
-        try:
-            val = self._style.lookup("Treeview", "background")
-        except tk.TclError:
-            val = None
+        val = self._cached_lookup("Treeview", "background")
         if not val:
-            try:
-                val = self._style.lookup("TFrame", "background")
-            except tk.TclError:
-                val = None
+            val = self._cached_lookup("TFrame", "background")
         if val:
             return val
         if not self._is_dark_theme:
@@ -1001,28 +1323,41 @@ class ThemeAdapter:
         return self._fallback_table_bg
 
     def table_foreground_color(self) -> str:
-        try:
-            val = self._style.lookup("Treeview", "foreground")
-        except tk.TclError:
-            val = None
+        val = self._cached_lookup("Treeview", "foreground")
         if not val:
-            try:
-                val = self._style.lookup("TLabel", "foreground")
-            except tk.TclError:
-                val = None
+            val = self._cached_lookup("TLabel", "foreground")
         if val:
             return val
-        if not self._is_dark_theme:
-            return "SystemWindowText"
-        return self._fallback_table_header_fg
+        return self._table_fg_fallback
 
     def table_stripe_color(self) -> str:
         base = self.table_background_color()
-        factor = 1.08 if self._is_dark_theme else 0.98
-        tinted = self._tint_color(base, factor)
-        if tinted:
-            return tinted
-        return self._fallback_table_stripe
+        key = (base, self._is_dark_theme)
+        cached = self._stripe_cache.get(key)
+        if cached is not None:
+            return cached
+        factor = _STRIPE_TINT_FACTORS[self._is_dark_theme]
+        stripe = self._tint_color(base, factor) or self._fallback_table_stripe
+        self._stripe_cache[key] = stripe
+        return stripe
+
+    @staticmethod
+    def _tint_color(color: str, factor: float) -> Optional[str]:
+        """Scale a ``#rrggbb`` colour by ``factor``; ``None`` for names Tk resolves itself."""
+        if not isinstance(color, str) or len(color) != 7 or not color.startswith("#"):
+            return None
+        try:
+            packed = int(color[1:], 16)
+        except ValueError:
+            return None
+        if packed < 0:
+            return None
+        # Fixed-point scaling (factor * 1024) with rounding; one hex parse for all channels.
+        factor_q = int(round(max(0.0, factor) * 1024))
+        red = min(255, (((packed >> 16) & 0xFF) * factor_q + 512) >> 10)
+        green = min(255, (((packed >> 8) & 0xFF) * factor_q + 512) >> 10)
+        blue = min(255, ((packed & 0xFF) * factor_q + 512) >> 10)
+        return f"#{(red << 16) | (green << 8) | blue:06x}"
 
     def table_header_background_color(self) -> str:
         return self._fallback_table_header_bg
@@ -1060,12 +1395,14 @@ class ThemeAdapter:
         return self._fallback_panel_bg
 
     def highlight_text_color(self) -> str:
-        if self._is_dark_theme:
-            return "#000000"
-        return "#ffffff"
+        return self._highlight_text
 
     def _get_config_dark_text(self) -> Optional[str]:
-        return self._get_config_str("dark_text")
+        # EDMC only changes dark_text alongside a theme change, which resets the cache.
+        if not self._dark_text_loaded:
+            self._dark_text = self._get_config_str("dark_text")
+            self._dark_text_loaded = True
+        return self._dark_text
 
 
 __all__ = ["ThemeAdapter"]
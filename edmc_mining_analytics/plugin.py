@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -58,22 +60,20 @@ GITHUB_RELEASES_API = (
     "https://api.github.com/repos/SweetJonnySauce/EDMC-Mining-Analytics/releases/latest"
 )
 GITHUB_TAGS_API = "https://api.github.com/repos/SweetJonnySauce/EDMC-Mining-Analytics/tags?per_page=1"
+VERSION_CACHE_FILENAME = "version_check_cache.json"
+_ENTRY_COMMANDER_KEYS = ("Cmdr", "Commander", "UserName")
+_SHARED_STATE_COMMANDER_KEYS = ("Cmdr", "Commander")
 
 
 def _coerce_log_level(value: object) -> Optional[int]:
     if isinstance(value, int):
         return value
     if isinstance(value, str):
-        candidate = value.strip()
-        if not candidate:
-            return None
-        if candidate.isdigit():
-            try:
-                return int(candidate)
-            except ValueError:
-                return None
-        upper = candidate.upper()
-        return logging._nameToLevel.get(upper)  # type: ignore[attr-defined]
+        candidate = value.strip().upper()
+        if candidate.isdecimal():
+            return int(candidate)
+        # Read live so levels registered after import (e.g. EDMC's TRACE) resolve.
+        return logging._nameToLevel.get(candidate)  # type: ignore[attr-defined]
     return None
 
 
@@ -139,8 +139,13 @@ class MiningAnalyticsPlugin:
         self.update_manager: Optional[UpdateManager] = None
         self._overlay_refresh_job: Optional[str] = None
         self._overlay_rpm_refresh_job: Optional[str] = None
+        self._overlay_flush_job: Optional[str] = None
+        self._ui_refresh_job: Optional[str] = None
         self._overlay_enabled_last: bool = False
-        self._version_thread: Optional[threading.Thread] = None
+        self._root_destroyed = False
+        self._version_executor: Optional[ThreadPoolExecutor] = None
+        self._version_future: Optional[Future] = None
+        self._version_stop_event = threading.Event()
         self.ui = edmcmaMiningUI(
             self.state,
             self.inara,
@@ -154,7 +159,7 @@ class MiningAnalyticsPlugin:
         )
         self.journal = JournalProcessor(
             self.state,
-            refresh_ui=self._refresh_ui_safe,
+            refresh_ui=self._schedule_ui_refresh,
             on_session_start=self._on_session_start,
             on_session_end=self._on_session_end,
             persist_inferred_capacities=self._persist_inferred_capacities,
@@ -167,7 +172,7 @@ class MiningAnalyticsPlugin:
         self.plugin_dir: Optional[Path] = None
         self._latest_version: Optional[str] = None
         self._update_ready_version: Optional[str] = None
-        self._version_check_started = False
+        self._version_label_state: Optional[tuple[Optional[str], bool]] = None
         self._is_stopping = False
 
     # ------------------------------------------------------------------
@@ -218,13 +223,18 @@ class MiningAnalyticsPlugin:
         return PLUGIN_NAME
 
     def plugin_app(self, parent: tk.Widget) -> tk.Frame:
+        # Jobs queued on a previous frame die with it; never let them block the new one.
+        self._cancel_ui_refresh()
+        self._cancel_overlay_flush()
+        self._cancel_overlay_refresh()
+        self._cancel_overlay_rpm_refresh()
         frame = self.ui.build(parent)
+        self._root_destroyed = False
+        frame.bind("<Destroy>", self._handle_root_destroy, add="+")
         self._refresh_ui_safe()
-        self.ui.update_version_label(
-            PLUGIN_VERSION,
-            self._latest_version,
-            self._update_ready_version is not None,
-        )
+        label_state = (self._latest_version, self._update_ready_version is not None)
+        self._version_label_state = label_state
+        self.ui.update_version_label(PLUGIN_VERSION, *label_state)
         self.ui.schedule_rate_update()
         return frame
 
@@ -254,11 +264,13 @@ class MiningAnalyticsPlugin:
                 self.update_manager.stop()
             except Exception:
                 _log.exception("Failed to stop update manager")
-        self._wait_for_version_thread()
+        self._stop_version_check()
         self._persist_preferences()
         self.ui.cancel_rate_update()
         self.ui.close_histogram_windows()
         self.ui.close_local_web_server()
+        self._cancel_ui_refresh()
+        self._cancel_overlay_flush()
         self._cancel_overlay_refresh()
         self._cancel_overlay_rpm_refresh()
         self.overlay_helper.clear_preview()
@@ -306,6 +318,7 @@ class MiningAnalyticsPlugin:
             self.ui.cancel_rate_update()
 
         reset_mining_state(state)
+        self.journal.invalidate_shared_state()
         self.ui.clear_transient_widgets()
         self.ui.set_paused(False, source="system")
         self._refresh_ui_safe()
@@ -318,13 +331,59 @@ class MiningAnalyticsPlugin:
         if self._is_stopping:
             _log.debug("Skipping refresh scheduling because plugin is stopping")
             return
+        self._request_overlay_flush()
+
+    def _handle_root_destroy(self, event: tk.Event) -> None:
+        # Compare path names: Tk may deliver the event with the widget already unregistered.
+        if str(event.widget) == str(self.ui.get_root()):
+            self._root_destroyed = True
+            # destroy() drops the frame's after commands, so pending jobs will never run.
+            self._ui_refresh_job = None
+            self._overlay_flush_job = None
+            self._overlay_refresh_job = None
+            self._overlay_rpm_refresh_job = None
+
+    def _live_root(self) -> Optional[tk.Widget]:
+        # Tracked via <Destroy> so the per-tick checks avoid a winfo_exists() round-trip.
+        if self._root_destroyed:
+            return None
+        return self.ui.get_root()
+
+    def _request_overlay_flush(self) -> None:
+        # Journal bursts refresh the UI once per entry; push to the overlay once per burst.
+        if self._overlay_flush_job is not None:
+            return
+        frame = self._live_root()
+        if frame is not None:
+            try:
+                self._overlay_flush_job = frame.after_idle(self._flush_overlay)
+                return
+            except Exception:
+                pass
+        self._flush_overlay()
+
+    def _flush_overlay(self) -> None:
+        self._overlay_flush_job = None
+        if self._is_stopping:
+            return
         self._refresh_overlay_now()
         self._schedule_overlay_refresh()
         self._schedule_overlay_rpm_refresh()
 
+    def _cancel_overlay_flush(self) -> None:
+        if self._overlay_flush_job is None:
+            return
+        frame = self._live_root()
+        if frame is not None:
+            try:
+                frame.after_cancel(self._overlay_flush_job)
+            except tk.TclError:
+                pass
+        self._overlay_flush_job = None
+
     def _refresh_overlay_now(self) -> None:
         try:
-            self.overlay_helper.refresh_availability()
+            # push_metrics() re-checks availability itself whenever the overlay is enabled.
             self.overlay_helper.push_metrics()
         except Exception:
             _log.exception("Failed to update EDMCOverlay metrics")
@@ -336,8 +395,8 @@ class MiningAnalyticsPlugin:
             return
         if not self._should_refresh_overlay():
             return
-        frame = self.ui.get_root()
-        if frame is None or not frame.winfo_exists():
+        frame = self._live_root()
+        if frame is None:
             return
         interval_ms = max(100, int(self.state.overlay_refresh_interval_ms or 1000))
         delay_ms = interval_ms
@@ -354,30 +413,30 @@ class MiningAnalyticsPlugin:
             return
         if not self._should_refresh_overlay():
             return
-        frame = self.ui.get_root()
-        if frame is None or not frame.winfo_exists():
+        frame = self._live_root()
+        if frame is None:
             return
         self._overlay_rpm_refresh_job = frame.after(150, self._overlay_rpm_tick)
 
     def _cancel_overlay_refresh(self) -> None:
         if self._overlay_refresh_job is None:
             return
-        frame = self.ui.get_root()
-        if frame and frame.winfo_exists():
+        frame = self._live_root()
+        if frame is not None:
             try:
                 frame.after_cancel(self._overlay_refresh_job)
-            except Exception:
+            except tk.TclError:
                 pass
         self._overlay_refresh_job = None
 
     def _cancel_overlay_rpm_refresh(self) -> None:
         if self._overlay_rpm_refresh_job is None:
             return
-        frame = self.ui.get_root()
-        if frame and frame.winfo_exists():
+        frame = self._live_root()
+        if frame is not None:
             try:
                 frame.after_cancel(self._overlay_rpm_refresh_job)
-            except Exception:
+            except tk.TclError:
                 pass
         self._overlay_rpm_refresh_job = None
 
@@ -408,17 +467,33 @@ class MiningAnalyticsPlugin:
         return False
 
     def _schedule_ui_refresh(self) -> None:
-        if self._is_stopping:
+        # Journal bursts and integration callbacks share one pending refresh per Tk turn.
+        if self._is_stopping or self._ui_refresh_job is not None:
             return
-        frame = self.ui.get_root()
-        if frame is not None and frame.winfo_exists():
+        frame = self._live_root()
+        if frame is not None:
             try:
-                frame.after(0, self._refresh_ui_safe)
+                self._ui_refresh_job = frame.after(0, self._run_scheduled_ui_refresh)
                 return
             except Exception:
                 pass
         self._refresh_ui_safe()
 
+    def _run_scheduled_ui_refresh(self) -> None:
+        self._ui_refresh_job = None
+        self._refresh_ui_safe()
+
+    def _cancel_ui_refresh(self) -> None:
+        if self._ui_refresh_job is None:
+            return
+        frame = self._live_root()
+        if frame is not None:
+            try:
+                frame.after_cancel(self._ui_refresh_job)
+            except tk.TclError:
+                pass
+        self._ui_refresh_job = None
+
     def _persist_preferences(self) -> None:
         try:
             self.preferences.save(self.state)
@@ -505,44 +580,59 @@ class MiningAnalyticsPlugin:
         shared_state: Optional[dict],
         cmdr: Optional[str],
     ) -> None:
-        commander: Optional[str] = cmdr
-        if isinstance(entry, dict):
-            commander = commander or entry.get("Cmdr") or entry.get("Commander")
-            if not commander:
-                user = entry.get("UserName")
-                if isinstance(user, str) and user.strip():
-                    commander = user
-        if not commander and isinstance(shared_state, dict):
-            commander = shared_state.get("Cmdr") or shared_state.get("Commander")
-        if commander:
-            commander_str = str(commander).strip()
-            if commander_str:
-                self.state.cmdr_name = commander_str
+        # EDMC passes cmdr with nearly every entry, so that case returns after one strip.
+        if cmdr:
+            commander = str(cmdr).strip()
+            if commander:
+                self.state.cmdr_name = commander
+                return
+        for source, keys in (
+            (entry, _ENTRY_COMMANDER_KEYS),
+            (shared_state, _SHARED_STATE_COMMANDER_KEYS),
+        ):
+            if not isinstance(source, dict):
+                continue
+            for key in keys:
+                value = source.get(key)
+                if value:
+                    commander = str(value).strip()
+                    if commander:
+                        self.state.cmdr_name = commander
+                        return
 
     # ------------------------------------------------------------------
     # Version checking
     # ------------------------------------------------------------------
     def _ensure_version_check(self) -> None:
-        if self._version_check_started:
-            thread = self._version_thread
-            if thread and thread.is_alive():
-                return
-        self._version_check_started = True
-        thread = threading.Thread(target=self._check_for_updates, name="EDMCMiningVersion", daemon=False)
-        self._version_thread = thread
-        thread.start()
-
-    def _wait_for_version_thread(self, timeout: float = 5.0) -> None:
-        thread = self._version_thread
-        if thread and thread.is_alive():
-            try:
-                thread.join(timeout)
-            except Exception:
-                _log.exception("Failed while waiting for version check thread")
-            if thread.is_alive():
-                _log.debug("Version check thread still running after stop timeout")
-                return
-        self._version_thread = None
+        future = self._version_future
+        if future is not None and not future.done():
+            return
+        self._version_stop_event.clear()
+        executor = self._version_executor
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="EDMCMiningVersion")
+            self._version_executor = executor
+        future = executor.submit(self._check_for_updates)
+        future.add_done_callback(self._log_version_check_failure)
+        self._version_future = future
+
+    @staticmethod
+    def _log_version_check_failure(future: Future) -> None:
+        # Pool workers bypass threading.excepthook, so surface failures here instead.
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            _log.error("Version check failed unexpectedly", exc_info=exc)
+
+    def _stop_version_check(self) -> None:
+        # Don't wait on GitHub during shutdown; an in-flight probe discards its result.
+        self._version_stop_event.set()
+        executor = self._version_executor
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._version_executor = None
+        self._version_future = None
 
     def _fetch_latest_tag(self) -> Optional[str]:
         session = get_shared_session()
@@ -567,10 +657,58 @@ class MiningAnalyticsPlugin:
             tag = tag.split("/", 2)[-1]
         return tag if isinstance(tag, str) else None
 
+    def _version_cache_path(self) -> Optional[Path]:
+        if self.plugin_dir is None:
+            return None
+        return self.plugin_dir / "config" / VERSION_CACHE_FILENAME
+
+    def _load_version_cache(self) -> dict:
+        path = self._version_cache_path()
+        if path is None or not path.exists():
+            return {}
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            _log.debug("Ignoring unreadable version check cache: %s", path)
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def _store_version_cache(self, response: requests.Response, tag: str) -> None:
+        path = self._version_cache_path()
+        if path is None:
+            return
+        payload = {
+            "tag": tag,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        if not payload["etag"] and not payload["last_modified"]:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("w", encoding="utf-8") as handle:
+                json.dump(payload, handle, indent=2)
+        except OSError as exc:
+            _log.debug("Unable to write version check cache: %s", exc)
+
     def _check_for_updates(self) -> None:
+        if self._version_stop_event.is_set():
+            return
         session = get_shared_session()
+        cache = self._load_version_cache()
+        cached_tag = cache.get("tag")
+        headers = {}
+        # Conditional requests answered with 304 do not count against GitHub's rate limit.
+        if isinstance(cached_tag, str) and cached_tag:
+            etag = cache.get("etag")
+            last_modified = cache.get("last_modified")
+            if isinstance(etag, str) and etag:
+                headers["If-None-Match"] = etag
+            if isinstance(last_modified, str) and last_modified:
+                headers["If-Modified-Since"] = last_modified
         try:
-            response = session.get(GITHUB_RELEASES_API, timeout=5)
+            response = session.get(GITHUB_RELEASES_API, headers=headers or None, timeout=5)
             response.raise_for_status()
         except requests.HTTPError as exc:
             status = exc.response.status_code if exc.response is not None else "unknown"
@@ -588,6 +726,11 @@ class MiningAnalyticsPlugin:
             _log.debug("Version check failed: %s", exc)
             return
         else:
+            if response.status_code == 304 and headers:
+                _log.debug("Latest release unchanged since last check (%s)", cached_tag)
+                self._handle_latest_version(cached_tag)
+                return
+
             try:
                 payload = response.json()
             except ValueError:
@@ -599,9 +742,8 @@ class MiningAnalyticsPlugin:
                 _log.debug("Version check succeeded but no tag information was found")
                 return
 
+            self._store_version_cache(response, latest)
             self._handle_latest_version(latest)
-        finally:
-            self._version_thread = None
 
     def _log_version_status(self) -> None:
         if not self._latest_version:
@@ -627,18 +769,17 @@ class MiningAnalyticsPlugin:
     def _schedule_version_label_update(self) -> None:
         if self._is_stopping:
             return
+        label_state = (self._latest_version, self._update_ready_version is not None)
+        if label_state == self._version_label_state:
+            return
         root = self.ui.get_root()
         if root and getattr(root, "after", None):
-            root.after(
-                0,
-                lambda: self.ui.update_version_label(
-                    PLUGIN_VERSION,
-                    self._latest_version,
-                    self._update_ready_version is not None,
-                ),
-            )
+            self._version_label_state = label_state
+            root.after(0, lambda: self.ui.update_version_label(PLUGIN_VERSION, *label_state))
 
     def _handle_latest_version(self, latest: str) -> None:
+        if self._version_stop_event.is_set():
+            return
         latest_value = normalize_version(latest) or latest.strip()
         self._latest_version = latest_value
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence
 
 try:
     from config import config  # type: ignore[import]
@@ -242,29 +242,29 @@ class PreferencesManager:
             return
 
         try:
-            config.set("edmc_mining_histogram_bin", state.histogram_bin_size)
+            self._set("edmc_mining_histogram_bin", state.histogram_bin_size)
         except Exception:
             _log.exception("Failed to persist histogram bin size preference")
 
         try:
-            config.set("edmc_mining_rate_interval", state.rate_interval_seconds)
+            self._set("edmc_mining_rate_interval", state.rate_interval_seconds)
         except Exception:
             _log.exception("Failed to persist rate update interval")
 
         self.save_inferred_capacities(state)
 
         try:
-            config.set("edmc_mining_auto_unpause", int(state.auto_unpause_on_event))
+            self._set("edmc_mining_auto_unpause", int(state.auto_unpause_on_event))
         except Exception:
             _log.exception("Failed to persist auto-unpause preference")
 
         try:
-            config.set("edmc_mining_session_logging", int(state.session_logging_enabled))
+            self._set("edmc_mining_session_logging", int(state.session_logging_enabled))
         except Exception:
             _log.exception("Failed to persist session logging preference")
 
         try:
-            config.set(
+            self._set(
                 "edmc_mining_session_retention",
                 clamp_session_retention(state.session_log_retention),
             )
@@ -272,48 +272,48 @@ class PreferencesManager:
             _log.exception("Failed to persist session log retention preference")
 
         try:
-            config.set("edmc_mining_discord_webhook", state.discord_webhook_url or "")
+            self._set("edmc_mining_discord_webhook", state.discord_webhook_url or "")
         except Exception:
             _log.exception("Failed to persist Discord webhook")
 
         try:
-            config.set("edmc_mining_discord_summary", int(state.send_summary_to_discord))
+            self._set("edmc_mining_discord_summary", int(state.send_summary_to_discord))
         except Exception:
             _log.exception("Failed to persist Discord summary preference")
 
         try:
-            config.set("edmc_mining_discord_reset_summary", int(state.send_reset_summary))
+            self._set("edmc_mining_discord_reset_summary", int(state.send_reset_summary))
         except Exception:
             _log.exception("Failed to persist Discord reset summary preference")
 
         try:
             payload = json.dumps(state.discord_images)
-            config.set("edmc_mining_discord_images", payload)
+            self._set("edmc_mining_discord_images", payload)
         except Exception:
             _log.exception("Failed to persist Discord image list")
 
         try:
-            config.set("edmc_mining_discord_image", "")
+            self._set("edmc_mining_discord_image", "")
         except Exception:
             pass
 
         try:
-            config.set("edmc_mining_show_commodities", int(state.show_mined_commodities))
+            self._set("edmc_mining_show_commodities", int(state.show_mined_commodities))
         except Exception:
             _log.exception("Failed to persist commodities visibility preference")
 
         try:
-            config.set("edmc_mining_show_materials", int(state.show_materials_collected))
+            self._set("edmc_mining_show_materials", int(state.show_materials_collected))
         except Exception:
             _log.exception("Failed to persist materials visibility preference")
 
         try:
-            config.set("edmc_mining_warn_non_metallic", int(state.warn_on_non_metallic_ring))
+            self._set("edmc_mining_warn_non_metallic", int(state.warn_on_non_metallic_ring))
         except Exception:
             _log.exception("Failed to persist non-metallic warning preference")
 
         try:
-            config.set(
+            self._set(
                 "edmc_mining_rpm_red",
                 clamp_positive_int(state.rpm_threshold_red, 1),
             )
@@ -321,7 +321,7 @@ class PreferencesManager:
             _log.exception("Failed to persist RPM red threshold")
 
         try:
-            config.set(
+            self._set(
                 "edmc_mining_rpm_yellow",
                 clamp_positive_int(state.rpm_threshold_yellow, 20),
             )
@@ -329,7 +329,7 @@ class PreferencesManager:
             _log.exception("Failed to persist RPM yellow threshold")
 
         try:
-            config.set(
+            self._set(
                 "edmc_mining_rpm_green",
                 clamp_positive_int(state.rpm_threshold_green, 40),
             )
@@ -337,7 +337,7 @@ class PreferencesManager:
             _log.exception("Failed to persist RPM green threshold")
 
         try:
-            config.set(
+            self._set(
                 "edmc_mining_limpet_dump_threshold",
                 clamp_positive_int(state.limpet_dump_threshold, 5),
             )
@@ -345,12 +345,12 @@ class PreferencesManager:
             _log.exception("Failed to persist limpet dump threshold")
 
         try:
-            config.set("edmc_mining_overlay_enabled", int(state.overlay_enabled))
+            self._set("edmc_mining_overlay_enabled", int(state.overlay_enabled))
         except Exception:
             _log.exception("Failed to persist overlay enabled preference")
 
         try:
-            config.set(
+            self._set(
                 "edmc_mining_overlay_anchor_x",
                 clamp_overlay_coordinate(state.overlay_anchor_x, state.overlay_anchor_x),
             )
@@ -358,7 +358,7 @@ class PreferencesManager:
             _log.exception("Failed to persist overlay anchor X preference")
 
         try:
-            config.set(
+            self._set(
                 "edmc_mining_overlay_anchor_y",
                 clamp_overlay_coordinate(state.overlay_anchor_y, state.overlay_anchor_y),
             )
@@ -366,7 +366,7 @@ class PreferencesManager:
             _log.exception("Failed to persist overlay anchor Y preference")
 
         try:
-            config.set(
+            self._set(
                 "edmc_mining_overlay_refresh_ms",
                 clamp_overlay_interval(state.overlay_refresh_interval_ms, state.overlay_refresh_interval_ms),
             )
@@ -374,12 +374,12 @@ class PreferencesManager:
             _log.exception("Failed to persist overlay refresh interval preference")
 
         try:
-            config.set(OVERLAY_SHOW_BARS_KEY, int(state.overlay_show_bars))
+            self._set(OVERLAY_SHOW_BARS_KEY, int(state.overlay_show_bars))
         except Exception:
             _log.exception("Failed to persist overlay show bars preference")
 
         try:
-            config.set(
+            self._set(
                 OVERLAY_BARS_MAX_ROWS_KEY,
                 clamp_positive_int(state.overlay_bars_max_rows, 10, maximum=50),
             )
@@ -389,34 +389,34 @@ class PreferencesManager:
 
         try:
             value = "" if state.spansh_last_distance_min is None else str(float(state.spansh_last_distance_min))
-            config.set("edmc_mining_spansh_distance_min", value)
+            self._set("edmc_mining_spansh_distance_min", value)
         except Exception:
             _log.exception("Failed to persist Spansh minimum distance")
 
         try:
             value = "" if state.spansh_last_distance_max is None else str(float(state.spansh_last_distance_max))
-            config.set("edmc_mining_spansh_distance_max", value)
+            self._set("edmc_mining_spansh_distance_max", value)
         except Exception:
             _log.exception("Failed to persist Spansh maximum distance")
 
         if state.spansh_last_ring_signals is not None:
             try:
                 payload = json.dumps(self._normalise_string_list(state.spansh_last_ring_signals))
-                config.set("edmc_mining_spansh_ring_signals", payload)
+                self._set("edmc_mining_spansh_ring_signals", payload)
             except Exception:
                 _log.exception("Failed to persist Spansh ring signals")
 
         if state.spansh_last_reserve_levels is not None:
             try:
                 payload = json.dumps(self._normalise_string_list(state.spansh_last_reserve_levels))
-                config.set("edmc_mining_spansh_reserve_levels", payload)
+                self._set("edmc_mining_spansh_reserve_levels", payload)
             except Exception:
                 _log.exception("Failed to persist Spansh reserve levels")
 
         if state.spansh_last_ring_types is not None:
             try:
                 payload = json.dumps(self._normalise_string_list(state.spansh_last_ring_types))
-                config.set("edmc_mining_spansh_ring_types", payload)
+                self._set("edmc_mining_spansh_ring_types", payload)
             except Exception:
                 _log.exception("Failed to persist Spansh ring types")
 
@@ -426,7 +426,7 @@ class PreferencesManager:
                 if state.spansh_last_min_hotspots is not None
                 else ""
             )
-            config.set("edmc_mining_spansh_min_hotspots", value)
+            self._set("edmc_mining_spansh_min_hotspots", value)
         except Exception:
             _log.exception("Failed to persist Spansh minimum hotspots")
 
@@ -434,53 +434,68 @@ class PreferencesManager:
             value = str(state.spansh_last_yield_basis or "").strip().lower()
             if value not in {"all", "present"}:
                 value = ""
-            config.set("edmc_mining_spansh_yield_basis", value)
+            self._set("edmc_mining_spansh_yield_basis", value)
         except Exception:
             _log.exception("Failed to persist Spansh yield basis")
 
         try:
             value = "1" if state.market_search_has_large_pad else ""
-            config.set("edmc_mining_market_large_pad", value)
+            self._set("edmc_mining_market_large_pad", value)
         except Exception:
             _log.exception("Failed to persist market search large pad preference")
 
         try:
-            config.set("edmc_mining_market_sort", state.market_search_sort_mode or "best_price")
+            self._set("edmc_mining_market_sort", state.market_search_sort_mode or "best_price")
         except Exception:
             _log.exception("Failed to persist market search sort preference")
 
         try:
-            config.set("edmc_mining_market_include_carriers", int(state.market_search_include_carriers))
+            self._set("edmc_mining_market_include_carriers", int(state.market_search_include_carriers))
         except Exception:
             _log.exception("Failed to persist market search carriers preference")
 
         try:
-            config.set("edmc_mining_market_include_surface", int(state.market_search_include_surface))
+            self._set("edmc_mining_market_include_surface", int(state.market_search_include_surface))
         except Exception:
             _log.exception("Failed to persist market search surface preference")
 
         try:
-            config.set("edmc_mining_market_min_demand", int(state.market_search_min_demand))
+            self._set("edmc_mining_market_min_demand", int(state.market_search_min_demand))
         except Exception:
             _log.exception("Failed to persist market search min demand")
 
         try:
-            config.set("edmc_mining_market_age_days", int(state.market_search_age_days))
+            self._set("edmc_mining_market_age_days", int(state.market_search_age_days))
         except Exception:
             _log.exception("Failed to persist market search age days")
 
         try:
-            config.set("edmc_mining_market_distance_ly", str(float(state.market_search_distance_ly)))
+            self._set("edmc_mining_market_distance_ly", str(float(state.market_search_distance_ly)))
         except Exception:
             _log.exception("Failed to persist market search distance")
 
         try:
             value = "" if state.market_search_distance_ls is None else str(float(state.market_search_distance_ls))
-            config.set("edmc_mining_market_distance_ls", value)
+            self._set("edmc_mining_market_distance_ls", value)
         except Exception:
             _log.exception("Failed to persist market search distance to arrival")
 
 
+    def _set(self, key: str, value: Any) -> None:
+        # config.set is a registry/ini write; skip it when config already holds the value.
+        # Compare against config itself so changes made elsewhere are never masked.
+        if self._stored_value(key, value) == value:
+            return
+        config.set(key, value)
+
+    @staticmethod
+    def _stored_value(key: str, value: Any) -> Any:
+        getter = config.get_int if isinstance(value, int) else config.get_str
+        try:
+            return getter(key=key, default=None)  # type: ignore[arg-type]
+        except Exception:
+            return None
+
     @staticmethod
     def _get_int(key: str, default: int) -> int:
         if config is None:
@@ -576,7 +591,7 @@ class PreferencesManager:
             return
 
         try:
-            config.set("edmc_mining_inferred_cargo_map", payload)
+            self._set("edmc_mining_inferred_cargo_map", payload)
         except Exception:
             _log.exception("Failed to persist inferred cargo capacities")
 
@@ -637,6 +652,6 @@ class PreferencesManager:
         if config is None:
             return
         try:
-            config.set("edmc_mining_inferred_cargo_map", "{}")
+            self._set("edmc_mining_inferred_cargo_map", "{}")
         except Exception:
             _log.exception("Failed to clear inferred cargo capacities from config")
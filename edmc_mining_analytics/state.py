@@ -9,8 +9,9 @@ from pathlib import Path
 from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 
-ProspectKey = Tuple[str, Tuple[Tuple[str, float], ...]]
+ProspectKey = int
 RPM_LOOKBACK_SECONDS = 10
+PROSPECTED_SEEN_LIMIT = 10_000
 
 
 @dataclass
@@ -58,7 +59,9 @@ class MiningState:
     session_log_retention: int = 30
 
     prospected_seen: Set[ProspectKey] = field(default_factory=set)
+    prospected_seen_order: Deque[ProspectKey] = field(default_factory=deque)
     prospected_samples: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    prospected_stats: Dict[str, List[float]] = field(default_factory=dict)
     prospected_histogram: Dict[str, Counter[int]] = field(default_factory=lambda: defaultdict(Counter))
 
     cargo_capacity: Optional[int] = None
@@ -171,7 +174,9 @@ def reset_mining_state(state: MiningState) -> None:
     state.last_cargo_counts.clear()
 
     state.prospected_seen.clear()
+    state.prospected_seen_order.clear()
     state.prospected_samples.clear()
+    state.prospected_stats.clear()
     state.prospected_histogram.clear()
     state.current_cargo_tonnage = 0
     state.current_ship = None
@@ -203,25 +208,85 @@ def resolve_commodity_display_name(state: MiningState, commodity: str) -> str:
     return text.replace("_", " ").title()
 
 
+def _histogram_bin(value: float, size: int) -> int:
+    clamped = max(0.0, min(value, 100.0))
+    if clamped >= 100.0:
+        clamped = 100.0 - 1e-9
+    return int(clamped // size)
+
+
+def remember_prospect_key(state: MiningState, key: ProspectKey) -> None:
+    """Mark an asteroid as seen, forgetting the oldest once the cap is reached."""
+
+    if key in state.prospected_seen:
+        return
+    state.prospected_seen.add(key)
+    state.prospected_seen_order.append(key)
+    while len(state.prospected_seen_order) > PROSPECTED_SEEN_LIMIT:
+        state.prospected_seen.discard(state.prospected_seen_order.popleft())
+
+
+def add_prospected_sample(state: MiningState, material: str, proportion: float) -> None:
+    """Record one prospected proportion and bin it into the live histogram."""
+
+    state.prospected_samples.setdefault(material, []).append(proportion)
+    stats = state.prospected_stats.get(material)
+    if stats is None:
+        state.prospected_stats[material] = [1, proportion, proportion, proportion]
+    else:
+        stats[0] += 1
+        if proportion < stats[1]:
+            stats[1] = proportion
+        if proportion > stats[2]:
+            stats[2] = proportion
+        stats[3] += proportion
+    counter = state.prospected_histogram.get(material)
+    if counter is None:
+        counter = state.prospected_histogram[material] = Counter()
+    counter[_histogram_bin(proportion, max(1, state.histogram_bin_size))] += 1
+
+
+def prospected_range(state: MiningState, material: str) -> Optional[Tuple[int, float, float, float]]:
+    """Return ``(count, min, avg, max)`` for a material's prospected proportions."""
+
+    stats = state.prospected_stats.get(material)
+    if not stats:
+        return None
+    count, low, high, total = stats
+    return int(count), low, total / count, high
+
+
 def recompute_histograms(state: MiningState) -> None:
-    """Recompute prospecting histograms based on collected samples."""
+    """Recompute prospecting histograms and running stats from collected samples.
+
+    Only needed when the bin size changes or the samples were edited directly;
+    new samples are binned incrementally by :func:`add_prospected_sample`.
+    """
 
     histogram: Dict[str, Counter[int]] = defaultdict(Counter)
+    stats: Dict[str, List[float]] = {}
     size = max(1, state.histogram_bin_size)
     for material, samples in state.prospected_samples.items():
         if not samples:
             continue
         counter = histogram[material]
+        entry: Optional[List[float]] = None
         for value in samples:
             try:
-                clamped = max(0.0, min(float(value), 100.0))
+                proportion = float(value)
+                bin_index = _histogram_bin(proportion, size)
             except (TypeError, ValueError):
                 continue
-            if clamped >= 100.0:
-                clamped = 100.0 - 1e-9
-            bin_index = int(clamped // size)
             counter[bin_index] += 1
+            if entry is None:
+                entry = stats[material] = [1, proportion, proportion, proportion]
+            else:
+                entry[0] += 1
+                entry[1] = min(entry[1], proportion)
+                entry[2] = max(entry[2], proportion)
+                entry[3] += proportion
     state.prospected_histogram = histogram
+    state.prospected_stats = stats
 
 
 def recompute_market_sell_totals(state: MiningState) -> None:
@@ -10,6 +10,32 @@ try:
 except ImportError as exc:  # pragma: no cover
     raise RuntimeError("Tkinter must be available for EDMC plugins") from exc
 
+# Pointer motion arrives at sample rate; follow it at most about once per frame.
+_MOTION_THROTTLE_MS = 16
+
+# (TLabel background, TFrame background, TLabel foreground); cleared on <<ThemeChanged>>.
+_style_colors: Optional[Tuple[str, str, str]] = None
+
+
+def _lookup_style_colors(widget: tk.Misc) -> Tuple[str, str, str]:
+    global _style_colors
+    if _style_colors is None:
+        try:
+            style = ttk.Style(widget)
+        except tk.TclError:
+            style = ttk.Style()
+        _style_colors = (
+            str(style.lookup("TLabel", "background") or ""),
+            str(style.lookup("TFrame", "background") or ""),
+            str(style.lookup("TLabel", "foreground") or ""),
+        )
+    return _style_colors
+
+
+def _invalidate_style_colors(_event: Optional[tk.Event] = None) -> None:
+    global _style_colors
+    _style_colors = None
+
 
 class TreeTooltip:
     """Simple tooltip helper for Treeview widgets."""
@@ -24,6 +50,7 @@ class TreeTooltip:
         tree.bind("<Motion>", self._on_motion, add="+")
         tree.bind("<Leave>", self._hide_tip, add="+")
         tree.bind("<ButtonPress>", self._hide_tip, add="+")
+        tree.bind("<<ThemeChanged>>", _invalidate_style_colors, add="+")
 
     def clear(self) -> None:
         self._cell_texts.clear()
@@ -91,7 +118,7 @@ class TreeTooltip:
         tip.wm_overrideredirect(True)
         tip.wm_geometry(f"+{x}+{y}")
         try:
-            style = ttk.Style(self._tree)
+            label_bg, frame_bg, label_fg = _lookup_style_colors(self._tree)
         except tk.TclError:
             tip.destroy()
             return
@@ -99,13 +126,8 @@ class TreeTooltip:
             tree_background = self._tree.cget("background")
         except tk.TclError:
             tree_background = None
-        bg = (
-            style.lookup("TLabel", "background")
-            or style.lookup("TFrame", "background")
-            or tree_background
-            or "#ffffe0"
-        )
-        fg = style.lookup("TLabel", "foreground") or "#000000"
+        bg = label_bg or frame_bg or tree_background or "#ffffe0"
+        fg = label_fg or "#000000"
         label = tk.Label(
             tip,
             text=text,
@@ -142,10 +164,13 @@ class WidgetTooltip:
         self._hover_predicate = hover_predicate
         self._clones: List["WidgetTooltip"] = []
         self._source: Optional["WidgetTooltip"] = None
+        self._motion_job: Optional[str] = None
+        self._motion_event: Optional[tk.Event] = None
 
         widget.bind("<Enter>", self._on_enter, add="+")
         widget.bind("<Leave>", self._on_leave, add="+")
         widget.bind("<Motion>", self._on_motion, add="+")
+        widget.bind("<<ThemeChanged>>", _invalidate_style_colors, add="+")
         tooltips: List["WidgetTooltip"] = getattr(widget, "_edmcma_tooltips", [])
         tooltips.append(self)
         setattr(widget, "_edmcma_tooltips", tooltips)
@@ -176,11 +201,35 @@ class WidgetTooltip:
         self._maybe_show(event)
 
     def _on_motion(self, event: tk.Event) -> None:  # type: ignore[override]
-        self._maybe_show(event)
+        self._motion_event = event
+        if self._motion_job is not None:
+            return
+        try:
+            self._motion_job = self._widget.after(_MOTION_THROTTLE_MS, self._flush_motion)
+        except tk.TclError:
+            self._flush_motion()
+
+    def _flush_motion(self) -> None:
+        self._motion_job = None
+        event = self._motion_event
+        self._motion_event = None
+        if event is not None:
+            self._maybe_show(event)
 
     def _on_leave(self, _event: tk.Event) -> None:  # type: ignore[override]
+        self._cancel_motion()
         self._hide()
 
+    def _cancel_motion(self) -> None:
+        job = self._motion_job
+        self._motion_job = None
+        self._motion_event = None
+        if job is not None:
+            try:
+                self._widget.after_cancel(job)
+            except tk.TclError:
+                pass
+
     def clone_to(self, widget: tk.Widget) -> "WidgetTooltip":
         clone = self._make_clone(widget)
         clone._source = self
@@ -258,15 +307,7 @@ class WidgetTooltip:
         self._label = None
 
     def _resolve_colors(self) -> Tuple[str, str]:
-        try:
-            style = ttk.Style(self._widget)
-        except tk.TclError:
-            style = ttk.Style()
-        bg = (
-            style.lookup("TLabel", "background")
-            or style.lookup("TFrame", "background")
-            or self._widget.cget("background")
-            or "#ffffe0"
-        )
-        fg = style.lookup("TLabel", "foreground") or "#000000"
+        label_bg, frame_bg, label_fg = _lookup_style_colors(self._widget)
+        bg = label_bg or frame_bg or self._widget.cget("background") or "#ffffe0"
+        fg = label_fg or "#000000"
         return fg, bg
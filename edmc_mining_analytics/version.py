@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Iterable, Tuple
 
 
@@ -25,8 +26,13 @@ def normalize_version(value: str) -> str:
     return value.strip().lstrip("vV")
 
 
+@lru_cache(maxsize=64)
 def _version_key(value: str) -> Tuple[Tuple[int, object], ...]:
-    """Convert a version string into a sortable key."""
+    """Convert a version string into a sortable key.
+
+    Cached because the same handful of strings (the running version and the
+    latest published one) are compared on every version-label refresh.
+    """
 
     normalized = normalize_version(value)
     if not normalized:
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from edmc_mining_analytics.mining_ui.main_mining_ui import edmcmaMiningUI
+from edmc_mining_analytics.state import MiningState, add_prospected_sample
+
+
+class _FakeLabel:
+    def grid(self) -> None:
+        return
+
+    def grid_remove(self) -> None:
+        return
+
+
+class _FakeInara:
+    def __init__(self) -> None:
+        self.commodity_map = {"platinum": 1, "painite": 2}
+        self.opened: list[str] = []
+
+    def open_link(self, commodity: str) -> None:
+        self.opened.append(commodity)
+
+
+def _build_ui(monkeypatch) -> tuple[edmcmaMiningUI, MiningState, _FakeInara, list[str]]:
+    state = MiningState()
+    state.current_system = "Sol"
+    inara = _FakeInara()
+    ui = edmcmaMiningUI(state, inara, None, lambda: None)  # type: ignore[arg-type]
+    histograms: list[str] = []
+
+    def _ensure_row(row_index: int) -> list:
+        while len(ui._commodities_rows) <= row_index:
+            ui._commodities_rows.append([_FakeLabel() for _ in ui._commodity_columns])
+        return ui._commodities_rows[row_index]
+
+    monkeypatch.setattr(ui, "_ensure_commodity_row", _ensure_row)
+    monkeypatch.setattr(ui, "_apply_label_style", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(ui, "open_histogram_window", histograms.append)
+    return ui, state, inara, histograms
+
+
+def _click(ui: edmcmaMiningUI, label: object) -> None:
+    ui._on_commodity_label_click(SimpleNamespace(widget=label))
+
+
+def test_label_click_dispatches_to_current_row_after_repopulate(monkeypatch) -> None:
+    ui, state, inara, histograms = _build_ui(monkeypatch)
+    range_column = next(i for i, column in enumerate(ui._commodity_columns) if column["key"] == "range")
+
+    state.cargo_additions["platinum"] = 4
+    state.harvested_commodities.add("platinum")
+    add_prospected_sample(state, "platinum", 30.0)
+    ui._populate_commodities_table({})
+    first_row = ui._commodities_rows[0]
+    _click(ui, first_row[0])
+    _click(ui, first_row[range_column])
+
+    assert inara.opened == ["platinum"]
+    assert histograms == ["platinum"]
+
+    state.cargo_additions = {"painite": 2}
+    ui._populate_commodities_table({})
+    _click(ui, first_row[0])
+    _click(ui, first_row[range_column])
+
+    assert inara.opened == ["platinum", "painite"]
+    assert histograms == ["platinum"]
+
+    state.cargo_additions = {}
+    ui._populate_commodities_table({})
+    _click(ui, first_row[0])
+
+    assert ui._commodity_click_actions == {}
+    assert inara.opened == ["platinum", "painite"]
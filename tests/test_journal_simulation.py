@@ -1,6 +1,6 @@
 import json
 import unittest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from edmc_mining_analytics.journal import JournalProcessor
@@ -203,6 +203,57 @@ class JournalSimulationTest(unittest.TestCase):
         self.assertTrue(self.state.is_mining)
         self.assertEqual(self.state.mining_ring, "Synuefe UZ-O c22-10 9 A Ring")
 
+    def test_shared_state_republished_only_after_relevant_events(self) -> None:
+        shared_state: dict = {}
+        self.processor.handle_entry({"event": "Music", "timestamp": self._timestamp(0)}, shared_state)
+        self.assertIn("edmc_mining_active", shared_state)
+
+        shared_state["edmc_mining_prospected"] = "sentinel"
+        self.processor.handle_entry({"event": "Music", "timestamp": self._timestamp(1)}, shared_state)
+        self.assertEqual(shared_state["edmc_mining_prospected"], "sentinel")
+
+        self.processor.handle_entry(
+            {"event": "LaunchDrone", "timestamp": self._timestamp(2), "Type": "Prospector"},
+            shared_state,
+        )
+        self.assertEqual(shared_state["edmc_mining_prospected"], 0)
+        self.assertTrue(shared_state["edmc_mining_active"])
+
+        shared_state["edmc_mining_prospected"] = "sentinel"
+        self.processor.invalidate_shared_state()
+        self.processor.handle_entry({"event": "Music", "timestamp": self._timestamp(3)}, shared_state)
+        self.assertEqual(shared_state["edmc_mining_prospected"], 0)
+
+    def test_shared_state_republished_after_bin_size_change(self) -> None:
+        shared_state: dict = {}
+        self.processor.handle_entry({"event": "Music", "timestamp": self._timestamp(0)}, shared_state)
+        self.assertEqual(shared_state["edmc_mining_histogram_bin"], 10)
+
+        self.state.histogram_bin_size = 5
+        self.processor.handle_entry({"event": "Music", "timestamp": self._timestamp(1)}, shared_state)
+
+        self.assertEqual(shared_state["edmc_mining_histogram_bin"], 5)
+
+    def test_shared_state_mining_start_follows_reassignment(self) -> None:
+        shared_state: dict = {}
+        first = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        second = datetime(2025, 1, 1, 13, 30, tzinfo=timezone.utc)
+
+        self.state.mining_start = first
+        self.processor.invalidate_shared_state()
+        self.processor.handle_entry({"event": "Music", "timestamp": self._timestamp(0)}, shared_state)
+        self.assertEqual(shared_state["edmc_mining_start"], first.isoformat())
+
+        self.state.mining_start = second
+        self.processor.invalidate_shared_state()
+        self.processor.handle_entry({"event": "Music", "timestamp": self._timestamp(1)}, shared_state)
+        self.assertEqual(shared_state["edmc_mining_start"], second.isoformat())
+
+        self.state.mining_start = None
+        self.processor.invalidate_shared_state()
+        self.processor.handle_entry({"event": "Music", "timestamp": self._timestamp(2)}, shared_state)
+        self.assertIsNone(shared_state["edmc_mining_start"])
+
     def test_replay_sample_journal(self) -> None:
         """Replay a captured journal slice to mirror EDMC runtime behaviour."""
 
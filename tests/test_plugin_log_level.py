@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+import edmc_mining_analytics.plugin as plugin_module
+
+
+def test_coerce_log_level_accepts_names_and_numbers() -> None:
+    assert plugin_module._coerce_log_level(" debug ") == logging.DEBUG
+    assert plugin_module._coerce_log_level("15") == 15
+    assert plugin_module._coerce_log_level(30) == logging.WARNING
+    assert plugin_module._coerce_log_level("verbose-ish") is None
+    assert plugin_module._coerce_log_level(None) is None
+
+
+def test_coerce_log_level_sees_levels_registered_after_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(logging._nameToLevel, "EDMCMA_TEST", 7)  # type: ignore[attr-defined]
+
+    assert plugin_module._coerce_log_level("edmcma_test") == 7
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import pytest
+
+import edmc_mining_analytics.plugin as plugin_module
+from tests.harness_test_utils import DummyUI, DummyUpdateManager
+
+
+class _IdleRoot:
+    def __init__(self) -> None:
+        self.idle: list = []
+        self.timers: list = []
+        self.cancelled: list = []
+
+    def winfo_exists(self) -> bool:
+        return True
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+        return f"idle#{len(self.idle)}"
+
+    def after(self, _delay, callback):
+        self.timers.append(callback)
+        return f"after#{len(self.timers)}"
+
+    def after_cancel(self, job) -> None:
+        self.cancelled.append(job)
+
+    def bind(self, *_args, **_kwargs) -> None:
+        return
+
+
+@pytest.fixture
+def plugin(monkeypatch):
+    root = _IdleRoot()
+
+    class _RootedUI(DummyUI):
+        def get_root(self):
+            return root
+
+    monkeypatch.setattr(plugin_module, "edmcmaMiningUI", _RootedUI)
+    monkeypatch.setattr(plugin_module, "UpdateManager", DummyUpdateManager)
+    instance = plugin_module.MiningAnalyticsPlugin()
+    instance.test_root = root
+    return instance
+
+
+def test_ui_refresh_burst_pushes_overlay_once(monkeypatch, plugin) -> None:
+    pushes: list[int] = []
+    monkeypatch.setattr(plugin.overlay_helper, "push_metrics", lambda: pushes.append(1))
+
+    for _ in range(5):
+        plugin._refresh_ui_safe()
+
+    assert pushes == []
+    assert len(plugin.test_root.idle) == 1
+
+    plugin.test_root.idle.pop()()
+
+    assert pushes == [1]
+    assert plugin._overlay_flush_job is None
+
+
+def test_destroyed_root_stops_overlay_scheduling(plugin) -> None:
+    class _Event:
+        widget = plugin.test_root
+
+    plugin._handle_root_destroy(_Event())
+
+    assert plugin._live_root() is None
+    plugin._refresh_ui_safe()
+    assert plugin.test_root.idle == []
+
+
+def test_journal_burst_refreshes_ui_once(monkeypatch, plugin) -> None:
+    refreshes: list[int] = []
+    monkeypatch.setattr(plugin.ui, "refresh", lambda: refreshes.append(1), raising=False)
+
+    for _ in range(5):
+        plugin.journal.handle_entry({"event": "Music", "timestamp": "2025-01-01T00:00:00Z"})
+
+    assert refreshes == []
+    assert len(plugin.test_root.timers) == 1
+
+    plugin.test_root.timers.pop()()
+
+    assert refreshes == [1]
+    assert plugin._ui_refresh_job is None
+
+
+def test_destroy_with_pending_jobs_does_not_block_later_refreshes(monkeypatch, plugin) -> None:
+    refreshes: list[int] = []
+    monkeypatch.setattr(plugin.ui, "refresh", lambda: refreshes.append(1), raising=False)
+
+    plugin._schedule_ui_refresh()
+    plugin._request_overlay_flush()
+    assert plugin._ui_refresh_job is not None
+    assert plugin._overlay_flush_job is not None
+
+    class _Event:
+        widget = plugin.test_root
+
+    plugin._handle_root_destroy(_Event())
+
+    assert plugin._ui_refresh_job is None
+    assert plugin._overlay_flush_job is None
+    plugin._schedule_ui_refresh()
+    assert refreshes == [1]
+
+
+def test_plugin_app_rebuild_drops_jobs_from_previous_frame(plugin) -> None:
+    plugin._schedule_ui_refresh()
+    stale_job = plugin._ui_refresh_job
+
+    plugin.plugin_app(plugin.test_root)
+
+    assert stale_job in plugin.test_root.cancelled
+    assert plugin._ui_refresh_job is None
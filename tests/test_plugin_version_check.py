@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import edmc_mining_analytics.plugin as plugin_module
+from tests.harness_test_utils import DummyUI, DummyUpdateManager
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, payload=None, headers=None) -> None:
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        return
+
+    def json(self):
+        if self._payload is None:
+            raise AssertionError("304 responses must not be parsed")
+        return self._payload
+
+
+class _FakeSession:
+    def __init__(self, response: _FakeResponse) -> None:
+        self.response = response
+        self.calls: list[dict] = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append({"url": url, "headers": headers})
+        return self.response
+
+
+@pytest.fixture
+def plugin(monkeypatch, tmp_path):
+    monkeypatch.setattr(plugin_module, "edmcmaMiningUI", DummyUI)
+    monkeypatch.setattr(plugin_module, "UpdateManager", DummyUpdateManager)
+    instance = plugin_module.MiningAnalyticsPlugin()
+    instance.plugin_dir = tmp_path
+    return instance
+
+
+def _install_session(monkeypatch, response: _FakeResponse) -> _FakeSession:
+    session = _FakeSession(response)
+    monkeypatch.setattr(plugin_module, "get_shared_session", lambda: session)
+    return session
+
+
+def test_check_for_updates_persists_release_validators(monkeypatch, plugin, tmp_path) -> None:
+    session = _install_session(
+        monkeypatch,
+        _FakeResponse(200, {"tag_name": "v9.9.9"}, {"ETag": '"abc"', "Last-Modified": "Mon"}),
+    )
+
+    plugin._check_for_updates()
+
+    assert session.calls[0]["headers"] is None
+    assert plugin._latest_version == "9.9.9"
+    cache = json.loads((tmp_path / "config" / plugin_module.VERSION_CACHE_FILENAME).read_text())
+    assert cache == {"tag": "v9.9.9", "etag": '"abc"', "last_modified": "Mon"}
+
+
+def test_check_for_updates_reuses_cached_tag_on_not_modified(monkeypatch, plugin, tmp_path) -> None:
+    cache_path = tmp_path / "config" / plugin_module.VERSION_CACHE_FILENAME
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(json.dumps({"tag": "v9.9.9", "etag": '"abc"', "last_modified": None}))
+    session = _install_session(monkeypatch, _FakeResponse(304))
+
+    plugin._check_for_updates()
+
+    assert session.calls[0]["headers"] == {"If-None-Match": '"abc"'}
+    assert plugin._latest_version == "9.9.9"
+
+
+def test_version_check_runs_on_pool_and_stop_releases_it(monkeypatch, plugin) -> None:
+    _install_session(monkeypatch, _FakeResponse(200, {"tag_name": "v9.9.9"}))
+
+    plugin._ensure_version_check()
+    future = plugin._version_future
+    assert future is not None
+    future.result(timeout=5)
+    assert plugin._latest_version == "9.9.9"
+
+    plugin._stop_version_check()
+    assert plugin._version_executor is None
+    assert plugin._version_future is None
+
+
+def test_probe_finishing_after_stop_is_discarded(monkeypatch, plugin) -> None:
+    _install_session(monkeypatch, _FakeResponse(200, {"tag_name": "v9.9.9"}))
+    plugin._stop_version_check()
+
+    plugin._handle_latest_version("v9.9.9")
+
+    assert plugin._latest_version is None
+
+
+def test_version_label_update_skipped_when_unchanged(monkeypatch, plugin) -> None:
+    scheduled: list = []
+
+    class _Root:
+        def after(self, _delay, callback):
+            scheduled.append(callback)
+
+    monkeypatch.setattr(plugin.ui, "get_root", lambda: _Root(), raising=False)
+    plugin._latest_version = "9.9.9"
+
+    plugin._schedule_version_label_update()
+    plugin._schedule_version_label_update()
+    assert len(scheduled) == 1
+
+    plugin._update_ready_version = "9.9.9"
+    plugin._schedule_version_label_update()
+    assert len(scheduled) == 2
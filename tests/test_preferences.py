@@ -79,3 +79,43 @@ def test_preferences_save_writes_prefixed_overlay_keys(monkeypatch) -> None:
     assert cfg.data[OVERLAY_BARS_MAX_ROWS_KEY] == 12
     assert LEGACY_OVERLAY_SHOW_BARS_KEY not in cfg.data
     assert LEGACY_OVERLAY_BARS_MAX_ROWS_KEY not in cfg.data
+
+
+def test_preferences_save_skips_unchanged_keys(monkeypatch) -> None:
+    cfg = _DummyConfig()
+    writes: list[str] = []
+    original_set = cfg.set
+
+    def _recording_set(key: str, value: Any) -> None:
+        writes.append(key)
+        original_set(key, value)
+
+    cfg.set = _recording_set  # type: ignore[method-assign]
+    monkeypatch.setattr(preferences_module, "config", cfg)
+    state = MiningState()
+    manager = PreferencesManager()
+
+    manager.save(state)
+    assert writes
+    writes.clear()
+
+    manager.save(state)
+    assert writes == []
+
+    state.overlay_bars_max_rows = 3
+    manager.save(state)
+    assert writes == [OVERLAY_BARS_MAX_ROWS_KEY]
+
+
+def test_preferences_save_restores_value_changed_elsewhere(monkeypatch) -> None:
+    cfg = _DummyConfig()
+    monkeypatch.setattr(preferences_module, "config", cfg)
+    state = MiningState()
+    state.overlay_bars_max_rows = 3
+    manager = PreferencesManager()
+
+    manager.save(state)
+    cfg.set(OVERLAY_BARS_MAX_ROWS_KEY, 9)
+    manager.save(state)
+
+    assert cfg.data[OVERLAY_BARS_MAX_ROWS_KEY] == 3
@@ -0,0 +1,74 @@
+from edmc_mining_analytics import state as state_module
+from edmc_mining_analytics.state import (
+    MiningState,
+    add_prospected_sample,
+    prospected_range,
+    recompute_histograms,
+    remember_prospect_key,
+    reset_mining_state,
+)
+
+
+def test_add_prospected_sample_matches_full_recompute() -> None:
+    state = MiningState()
+    state.histogram_bin_size = 10
+    for material, proportion in (
+        ("platinum", 0.0),
+        ("platinum", 19.99),
+        ("platinum", 100.0),
+        ("painite", 42.5),
+        ("painite", 47.0),
+    ):
+        add_prospected_sample(state, material, proportion)
+
+    incremental = {name: dict(counter) for name, counter in state.prospected_histogram.items()}
+    recompute_histograms(state)
+    rebuilt = {name: dict(counter) for name, counter in state.prospected_histogram.items()}
+
+    assert incremental == rebuilt
+    assert incremental == {"platinum": {0: 1, 1: 1, 9: 1}, "painite": {4: 2}}
+    assert state.prospected_samples["painite"] == [42.5, 47.0]
+
+
+def test_prospected_range_tracks_running_stats() -> None:
+    state = MiningState()
+    assert prospected_range(state, "platinum") is None
+
+    for proportion in (30.0, 10.0, 50.0):
+        add_prospected_sample(state, "platinum", proportion)
+
+    assert prospected_range(state, "platinum") == (3, 10.0, 30.0, 50.0)
+
+    reset_mining_state(state)
+    assert prospected_range(state, "platinum") is None
+    assert state.prospected_samples == {}
+
+    for proportion in (20.0, 40.0):
+        add_prospected_sample(state, "platinum", proportion)
+
+    assert prospected_range(state, "platinum") == (2, 20.0, 30.0, 40.0)
+
+
+def test_recompute_histograms_resyncs_stats_with_samples() -> None:
+    state = MiningState()
+    for proportion in (10.0, 50.0, 90.0):
+        add_prospected_sample(state, "platinum", proportion)
+
+    state.prospected_samples["platinum"] = [50.0, 90.0]
+    state.prospected_samples["gold"] = [12.0]
+    recompute_histograms(state)
+
+    assert prospected_range(state, "platinum") == (2, 50.0, 70.0, 90.0)
+    assert prospected_range(state, "gold") == (1, 12.0, 12.0, 12.0)
+    assert sum(state.prospected_histogram["platinum"].values()) == 2
+
+
+def test_remember_prospect_key_evicts_oldest(monkeypatch) -> None:
+    monkeypatch.setattr(state_module, "PROSPECTED_SEEN_LIMIT", 2)
+    state = MiningState()
+
+    for key in (1, 2, 2, 3):
+        remember_prospect_key(state, key)
+
+    assert state.prospected_seen == {2, 3}
+    assert list(state.prospected_seen_order) == [2, 3]
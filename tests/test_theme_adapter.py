@@ -0,0 +1,936 @@
+from __future__ import annotations
+
+import gc
+from typing import Any, Callable
+from weakref import WeakSet
+
+import pytest
+
+import edmc_mining_analytics.mining_ui.theme_adapter as theme_adapter_module
+from edmc_mining_analytics.mining_ui.theme_adapter import ThemeAdapter, tk, ttk
+
+
+class _FakeStyle:
+    def __init__(self, values: dict[tuple[str, str], str] | None = None) -> None:
+        self.values: dict[tuple[str, str], str] = dict(values or {})
+        self.lookup_calls: list[tuple[str, str]] = []
+        self.configure_calls: list[tuple[str, dict[str, Any]]] = []
+        self.map_calls: list[tuple[str, dict[str, Any]]] = []
+
+    def lookup(self, style: str, option: str) -> str:
+        self.lookup_calls.append((style, option))
+        return self.values.get((style, option), "")
+
+    def configure(self, style: str, **kwargs: Any) -> None:
+        self.configure_calls.append((style, kwargs))
+
+    def map(self, style: str, **kwargs: Any) -> None:
+        self.map_calls.append((style, kwargs))
+
+
+_IDLE_QUEUE: list[tuple[Callable[..., Any], tuple[Any, ...]]] = []
+
+
+def _run_idle() -> None:
+    while _IDLE_QUEUE:
+        func, args = _IDLE_QUEUE.pop(0)
+        func(*args)
+
+
+class _FakeWidgetMixin:
+    """Stand-in for Tk widget plumbing so the adapter runs without a display."""
+
+    widget_class = "Frame"
+
+    def __init__(self, **options: Any) -> None:  # noqa: D401 - bypass Tk construction
+        self.options: dict[str, Any] = dict(options)
+        self.configure_calls: list[dict[str, Any]] = []
+        self.bindings: dict[str, list[Callable[..., Any]]] = {}
+        self.alive = True
+
+    def configure(self, cnf: Any = None, **kwargs: Any) -> Any:
+        if isinstance(cnf, dict):
+            kwargs = {**cnf, **kwargs}
+        if not kwargs:
+            return {key: (key, key, key, value, value) for key, value in self.options.items()}
+        unknown = [key for key in kwargs if key not in self.options]
+        if unknown:
+            raise tk.TclError(f'unknown option "-{unknown[0]}"')
+        self.configure_calls.append(dict(kwargs))
+        self.options.update(kwargs)
+        return None
+
+    config = configure
+
+    def cget(self, key: str) -> Any:
+        if key not in self.options:
+            raise tk.TclError(f'unknown option "-{key}"')
+        return self.options[key]
+
+    def winfo_exists(self) -> int:
+        return 1 if self.alive else 0
+
+    def winfo_class(self) -> str:
+        return self.widget_class
+
+    def bind(self, sequence: str, func: Callable[..., Any], add: Any = None) -> str:
+        self.bindings.setdefault(sequence, []).append(func)
+        return sequence
+
+    def bind_all(self, sequence: str, func: Callable[..., Any], add: Any = None) -> str:
+        return self.bind(f"all{sequence}", func, add)
+
+    def nametowidget(self, name: str) -> Any:
+        return self
+
+    def after_idle(self, func: Callable[..., Any], *args: Any) -> str:
+        _IDLE_QUEUE.append((func, args))
+        return "after#idle"
+
+    def after(self, _ms: int, func: Callable[..., Any], *args: Any) -> str:
+        return self.after_idle(func, *args)
+
+    def grid(self, **_kwargs: Any) -> None:
+        self.gridded = True
+
+    def grid_remove(self) -> None:
+        self.gridded = False
+
+
+class _FakeFrame(_FakeWidgetMixin, tk.Frame):
+    widget_class = "TFrame"
+
+    def __init__(self) -> None:
+        super().__init__(background="", foreground="")
+
+
+class _FakeCheckbutton(_FakeWidgetMixin, tk.Checkbutton):
+    widget_class = "Checkbutton"
+
+    def __init__(self) -> None:
+        super().__init__(
+            background="",
+            activebackground="",
+            highlightthickness=1,
+            highlightbackground="",
+            highlightcolor="",
+            bd=2,
+            selectcolor="white",
+            relief="raised",
+            indicatoron=True,
+        )
+
+
+class _FakeButton(_FakeWidgetMixin, tk.Button):
+    widget_class = "Button"
+
+    def __init__(self) -> None:
+        super().__init__(
+            text="Go",
+            background="SystemButtonFace",
+            foreground="#000000",
+            activebackground="#e6e6e6",
+            activeforeground="#000000",
+            highlightbackground="",
+            highlightcolor="",
+            highlightthickness=0,
+            bd=2,
+            relief="raised",
+            padx=1,
+            pady=1,
+        )
+
+
+class _FakeLabel(_FakeWidgetMixin, tk.Label):
+    widget_class = "Label"
+
+    def __init__(self) -> None:
+        super().__init__(
+            text="",
+            background="",
+            activebackground="",
+            highlightbackground="",
+            highlightcolor="",
+            foreground="",
+            activeforeground="",
+            disabledforeground="",
+        )
+
+
+class _FakeConfig:
+    def __init__(self, data: dict[str, Any] | None = None) -> None:
+        self.data: dict[str, Any] = dict(data or {})
+
+    def get_int(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def get_str(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+
+class _FakeEdmcTheme:
+    def __init__(self, active: int = 0) -> None:
+        self.active = active
+        self.current: dict[str, str] = {}
+        self.registered: list[Any] = []
+        self.updated: list[Any] = []
+
+    def register(self, widget: Any) -> None:
+        self.registered.append(widget)
+
+    def update(self, widget: Any) -> None:
+        self.updated.append(widget)
+
+
+@pytest.fixture
+def fake_style(monkeypatch: pytest.MonkeyPatch) -> _FakeStyle:
+    _IDLE_QUEUE.clear()
+    style = _FakeStyle()
+    monkeypatch.setattr(theme_adapter_module.ttk, "Style", lambda *args, **kwargs: style)
+    monkeypatch.setattr(ThemeAdapter, "_STYLE", None)
+    monkeypatch.setattr(ThemeAdapter, "_dark_style_signature", None)
+    monkeypatch.setattr(theme_adapter_module, "_edmc_loaded", True)
+    monkeypatch.setattr(theme_adapter_module, "_theme_listeners", WeakSet())
+    monkeypatch.setattr(theme_adapter_module, "_theme_bound_roots", WeakSet())
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", None)
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", _FakeConfig({"theme": 0}))
+    return style
+
+
+def test_theme_listener_bound_once_per_root(fake_style: _FakeStyle) -> None:
+    adapter = ThemeAdapter()
+    frame, other = _FakeFrame(), _FakeFrame()
+
+    adapter.register(frame)
+    adapter.register(frame)
+    adapter.register(other)
+
+    assert len(frame.bindings["all<<ThemeChanged>>"]) == 1
+    assert "all<<ThemeChanged>>" not in other.bindings
+    assert not hasattr(frame, "_edmcma_theme_listener")
+
+
+def test_theme_listener_shared_per_root_and_drops_dead_adapters(fake_style: _FakeStyle) -> None:
+    frame = _FakeFrame()
+    first, second = ThemeAdapter(), ThemeAdapter()
+    first.register(frame)
+    second.register(frame)
+
+    assert frame.bindings["all<<ThemeChanged>>"] == [theme_adapter_module._dispatch_theme_change]
+    assert set(theme_adapter_module._theme_listeners) == {first, second}
+
+    del second
+    gc.collect()
+    handler = frame.bindings["all<<ThemeChanged>>"][0]
+    handler(None)
+
+    assert list(theme_adapter_module._theme_listeners) == [first]
+
+
+def test_theme_changed_burst_syncs_once(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    config = _FakeConfig({"theme": 0})
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", config)
+    adapter = ThemeAdapter()
+    frame = _FakeFrame()
+    adapter.register(frame)
+    handler = frame.bindings["all<<ThemeChanged>>"][0]
+    _IDLE_QUEUE.clear()
+    applied: list[bool] = []
+    original_apply = ThemeAdapter._apply_palette
+
+    def _record_apply(self: ThemeAdapter, is_dark: bool) -> None:
+        applied.append(is_dark)
+        original_apply(self, is_dark)
+
+    monkeypatch.setattr(ThemeAdapter, "_apply_palette", _record_apply)
+
+    config.data["theme"] = 1
+    for _ in range(5):
+        handler(None)
+
+    assert adapter.is_dark_theme
+    assert applied == [True]
+    _run_idle()
+    assert not adapter._theme_sync_pending
+
+
+def test_register_applies_light_palette_to_plain_widgets(fake_style: _FakeStyle) -> None:
+    fake_style.values[("TFrame", "background")] = "#101010"
+    fake_style.values[("TLabel", "foreground")] = "#202020"
+    adapter = ThemeAdapter()
+    frame = _FakeFrame()
+
+    adapter.register(frame)
+
+    assert frame.options["background"] == "#101010"
+    assert frame.options["foreground"] == "#202020"
+
+
+def test_checkbox_adjustments_follow_dark_theme(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    config = _FakeConfig({"theme": 1})
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", config)
+    adapter = ThemeAdapter()
+    checkbox = _FakeCheckbutton()
+
+    adapter.style_checkbox(checkbox)
+
+    assert adapter.is_dark_theme
+    assert checkbox.options["selectcolor"] == "black"
+    assert checkbox.options["highlightthickness"] == 0
+
+
+def test_alternate_palette_uses_fallbacks_in_one_configure(
+    monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle
+) -> None:
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", _FakeConfig({"theme": 1, "dark_text": "#abcdef"}))
+    adapter = ThemeAdapter()
+    label = _FakeLabel()
+
+    adapter._apply_alternate_palette(label)
+
+    assert label.configure_calls[0] == {
+        "background": "#000000",
+        "activebackground": "#ffb84a",
+        "highlightbackground": "#000000",
+        "highlightcolor": "#ffc266",
+        "foreground": "#abcdef",
+        "activeforeground": "#abcdef",
+        "disabledforeground": "#abcdef",
+    }
+    assert len(label.configure_calls) == 1
+
+
+def test_edmc_modules_resolved_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    sentinel_config = _FakeConfig()
+    monkeypatch.setattr(theme_adapter_module, "_edmc_loaded", False)
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", None)
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", None)
+
+    theme_adapter_module._load_edmc_modules()
+    loaded_config = theme_adapter_module.edmc_config
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", sentinel_config)
+    theme_adapter_module._load_edmc_modules()
+
+    assert loaded_config is not None
+    assert theme_adapter_module.edmc_config is sentinel_config
+
+
+def test_style_lookups_cached_until_palette_changes(fake_style: _FakeStyle) -> None:
+    fake_style.values[("Treeview", "background")] = "#333333"
+    adapter = ThemeAdapter()
+
+    assert adapter.table_background_color() == "#333333"
+    assert adapter.table_background_color() == "#333333"
+    assert fake_style.lookup_calls.count(("Treeview", "background")) == 1
+
+    adapter._ensure_theme_latest(force=True)
+    adapter.table_background_color()
+
+    assert fake_style.lookup_calls.count(("Treeview", "background")) == 2
+
+
+def test_theme_changed_drops_cached_style_lookups(fake_style: _FakeStyle) -> None:
+    fake_style.values[("Treeview", "background")] = "#333333"
+    adapter = ThemeAdapter()
+    assert adapter.table_background_color() == "#333333"
+
+    fake_style.values[("Treeview", "background")] = "#444444"
+    adapter._handle_theme_change()
+
+    assert not adapter.is_dark_theme
+    assert adapter.table_background_color() == "#444444"
+
+
+def test_theme_sync_without_dark_flip_refreshes_lookups(
+    monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle
+) -> None:
+    edmc_theme = _FakeEdmcTheme(active=1)
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", edmc_theme)
+    fake_style.values[("Treeview", "background")] = "#333333"
+    adapter = ThemeAdapter()
+    assert adapter.table_background_color() == "#333333"
+
+    # Dark -> transparent keeps the dark flag but still re-syncs the palette.
+    fake_style.values[("Treeview", "background")] = "#444444"
+    edmc_theme.active = 2
+
+    assert adapter.is_dark_theme
+    assert adapter.table_background_color() == "#444444"
+
+
+def test_theme_refreshes_coalesce_into_one_idle_drain(
+    monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle
+) -> None:
+    edmc_theme = _FakeEdmcTheme()
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", edmc_theme)
+    adapter = ThemeAdapter()
+    buttons = [_FakeButton() for _ in range(3)]
+
+    for button in buttons:
+        adapter._schedule_theme_refresh(button)
+        adapter._schedule_theme_refresh(button)
+
+    assert len(_IDLE_QUEUE) == 1
+    _run_idle()
+    assert edmc_theme.updated == buttons
+
+
+def test_theme_change_restyles_once_per_tick(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    config = _FakeConfig({"theme": 0})
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", config)
+    adapter = ThemeAdapter()
+    checkbox = _FakeCheckbutton()
+    adapter.style_checkbox(checkbox)
+
+    config.data["theme"] = 1
+    adapter._ensure_theme_latest()
+    adapter._ensure_theme_latest(force=True)
+
+    assert len(_IDLE_QUEUE) == 1
+    assert checkbox.options["selectcolor"] != "black"
+    _run_idle()
+    assert checkbox.options["selectcolor"] == "black"
+
+
+def test_alternate_content_sync_skips_unchanged_options(fake_style: _FakeStyle) -> None:
+    adapter = ThemeAdapter()
+    button = _FakeButton()
+    button.options.update(textvariable="", image="", compound="left", underline=-1, justify="", anchor="", font="")
+    alternate = _FakeLabel()
+    alternate.options.update(image="", compound="", underline=-1, state="normal")
+
+    adapter._synchronize_button_content(button, alternate)
+    adapter._synchronize_button_content(button, alternate)
+
+    assert alternate.configure_calls == [{"text": "Go", "image": "", "compound": "left", "underline": -1}]
+
+
+def test_mirror_uses_passed_options_without_cget(fake_style: _FakeStyle) -> None:
+    adapter = ThemeAdapter()
+    button = _FakeButton()
+    alternate = _FakeLabel()
+    alternate.options.update(state="normal", padx=0, pady=0)
+    adapter._alternate_buttons[button] = alternate
+
+    adapter._mirror_alternate_after_config(button, {"text": "Stop", "state": "disabled", "padding": "8 2"})
+
+    assert alternate.configure_calls[0] == {"state": "disabled", "text": "Stop", "padx": 8, "pady": 2}
+
+
+def test_plain_widget_registry_excludes_buttons(fake_style: _FakeStyle) -> None:
+    adapter = ThemeAdapter()
+    frame = _FakeFrame()
+    button = _FakeButton()
+
+    adapter.register(frame)
+    adapter.register(button)
+
+    assert set(adapter._plain_widgets) == {frame}
+    assert button.configure_calls == []
+
+
+def test_dark_palette_derivatives_computed_once_per_palette(
+    monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle
+) -> None:
+    edmc_theme = _FakeEdmcTheme(active=1)
+    edmc_theme.current = {"background": "#050505"}
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", edmc_theme)
+    adapter = ThemeAdapter()
+    first, second = _FakeLabel(), _FakeLabel()
+
+    adapter._apply_alternate_palette(first)
+    cached = adapter._alternate_palette_cache
+    adapter._apply_alternate_palette(second)
+    adapter._configure_dark_button_style()
+
+    assert adapter._alternate_palette_cache is cached
+    assert second.options["background"] == "#050505"
+    assert len(fake_style.configure_calls) == 1
+
+    edmc_theme.current = {"background": "#0a0a0a"}
+    adapter._apply_alternate_palette(first)
+
+    assert first.options["background"] == "#0a0a0a"
+
+
+def test_theme_detection_waits_for_theme_changed_event(
+    monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle
+) -> None:
+    config = _FakeConfig({"theme": 0})
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", config)
+    adapter = ThemeAdapter()
+
+    config.data["theme"] = 1
+    assert not adapter.is_dark_theme
+
+    adapter._handle_theme_change()
+    assert adapter.is_dark_theme
+
+
+@pytest.mark.parametrize(
+    ("padding", "expected"),
+    [
+        ("12 4", (12, 4)),
+        ("8,2", (8, 2)),
+        ("6.5 3.9", (6, 3)),
+        ("5p 3 4", (3, 4)),
+        ("7", (7, 7)),
+        ((10, 2), (10, 2)),
+        (("9",), (9, 9)),
+        (3.7, (3, 3)),
+        ("", (12, 4)),
+        (None, (12, 4)),
+    ],
+)
+def test_parse_padding(padding: Any, expected: tuple[int, int]) -> None:
+    assert ThemeAdapter._parse_padding(padding) == expected
+
+
+def test_dark_tk_button_styled_in_one_configure(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", _FakeConfig({"theme": 1}))
+    adapter = ThemeAdapter()
+    button = _FakeButton()
+
+    adapter.style_button(button)
+
+    assert len(button.configure_calls) == 1
+    assert button.options["background"] == "#f19a29"
+    assert button.options["highlightcolor"] == "#ffc266"
+    assert button.options["padx"] == 12
+
+
+def test_bulk_restyle_flushes_theme_updates_once(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    edmc_theme = _FakeEdmcTheme()
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", edmc_theme)
+    adapter = ThemeAdapter()
+    buttons = [_FakeButton() for _ in range(3)]
+    for button in buttons:
+        adapter.style_button(button)
+    _run_idle()
+    edmc_theme.updated.clear()
+
+    adapter._restyle_all()
+
+    assert len(_IDLE_QUEUE) == 1
+    _run_idle()
+    assert sorted(map(id, edmc_theme.updated)) == sorted(map(id, buttons))
+
+
+def test_dark_text_read_once_per_theme_change(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    config = _FakeConfig({"theme": 1, "dark_text": "#111111"})
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", config)
+    adapter = ThemeAdapter()
+
+    config.data["dark_text"] = "#222222"
+    assert adapter._resolve_dark_text() == "#111111"
+
+    adapter._handle_theme_change()
+    assert adapter._resolve_dark_text() == "#222222"
+
+
+def test_dark_palette_applied_once_at_startup(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", _FakeConfig({"theme": 1, "dark_text": "#abcdef"}))
+
+    adapter = ThemeAdapter()
+
+    assert adapter.table_header_foreground_color() == "#abcdef"
+    assert adapter.link_color() == "#268bd2"
+    assert len(fake_style.configure_calls) == 1
+
+
+def test_adapters_share_style_and_dark_button_configuration(
+    monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle
+) -> None:
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", _FakeConfig({"theme": 1}))
+
+    first = ThemeAdapter()
+    second = ThemeAdapter()
+
+    assert first._style is second._style
+    assert len(fake_style.configure_calls) == 1
+
+
+def test_adapter_has_no_instance_dict(fake_style: _FakeStyle) -> None:
+    adapter = ThemeAdapter()
+
+    assert not hasattr(adapter, "__dict__")
+    with pytest.raises(AttributeError):
+        adapter._unexpected = True  # type: ignore[attr-defined]
+
+
+def test_table_stripe_color_tints_base_and_caches(fake_style: _FakeStyle) -> None:
+    fake_style.values[("Treeview", "background")] = "#646464"
+    adapter = ThemeAdapter()
+
+    assert adapter.table_stripe_color() == "#626262"
+    assert adapter._stripe_cache == {("#646464", False): "#626262"}
+
+
+def test_table_stripe_color_falls_back_for_named_colors(fake_style: _FakeStyle) -> None:
+    fake_style.values[("Treeview", "background")] = "SystemWindow"
+    adapter = ThemeAdapter()
+
+    assert adapter.table_stripe_color() == "#23160d"
+
+
+def test_highlight_text_color_tracks_theme(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    config = _FakeConfig({"theme": 0})
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", config)
+    adapter = ThemeAdapter()
+    assert adapter.highlight_text_color() == "#ffffff"
+
+    config.data["theme"] = 1
+    adapter._handle_theme_change()
+
+    assert adapter.highlight_text_color() == "#000000"
+
+
+def test_table_foreground_fallback_tracks_theme(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    config = _FakeConfig({"theme": 0})
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", config)
+    adapter = ThemeAdapter()
+    assert adapter.table_foreground_color() == "SystemWindowText"
+
+    config.data["theme"] = 1
+    adapter._handle_theme_change()
+
+    assert adapter.table_foreground_color() == adapter.table_header_foreground_color()
+
+
+def test_tint_color_scales_and_clamps_channels() -> None:
+    assert ThemeAdapter._tint_color("#646464", 0.98) == "#626262"
+    assert ThemeAdapter._tint_color("#f0f0f0", 1.08) == "#ffffff"
+    assert ThemeAdapter._tint_color("#102030", 1.08) == "#112334"
+    assert ThemeAdapter._tint_color("#-12345", 1.0) is None
+    assert ThemeAdapter._tint_color("SystemWindow", 1.08) is None
+
+
+def test_styling_buttons_does_not_resync_unchanged_theme(
+    monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle
+) -> None:
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", _FakeEdmcTheme(active=0))
+    adapter = ThemeAdapter()
+    _IDLE_QUEUE.clear()
+    applied: list[bool] = []
+    monkeypatch.setattr(ThemeAdapter, "_apply_palette", lambda self, is_dark: applied.append(is_dark))
+
+    for _ in range(3):
+        adapter.style_button(_FakeButton())
+
+    assert applied == []
+    assert not adapter._restyle_pending
+
+
+def test_plain_widgets_styled_with_one_configure(fake_style: _FakeStyle) -> None:
+    adapter = ThemeAdapter()
+    labels = [_FakeLabel(), _FakeLabel()]
+
+    for label in labels:
+        adapter.register(label)
+
+    for label in labels:
+        assert len(label.configure_calls) == 1
+        assert set(label.configure_calls[0]) == {"background", "foreground"}
+
+
+def test_plain_widget_styles_only_supported_options(fake_style: _FakeStyle) -> None:
+    class _FakeTtkLabel(_FakeWidgetMixin, ttk.Label):
+        widget_class = "TLabel"
+
+        def __init__(self) -> None:
+            super().__init__(foreground="")
+
+    adapter = ThemeAdapter()
+    first, second = _FakeTtkLabel(), _FakeTtkLabel()
+    adapter.register(first)
+    adapter.register(second)
+
+    assert adapter._class_options["TLabel"] == frozenset({"foreground"})
+    assert [set(call) for call in first.configure_calls] == [{"foreground"}]
+    assert [set(call) for call in second.configure_calls] == [{"foreground"}]
+
+
+def test_dark_restyle_paints_each_alternate_once(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    edmc_theme = _FakeEdmcTheme(active=1)
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", edmc_theme)
+    adapter = ThemeAdapter()
+    button, alternate = _FakeButton(), _FakeLabel()
+    adapter._track_alternate(button, alternate)
+    _IDLE_QUEUE.clear()
+
+    adapter._restyle_all()
+    painted = [call for call in alternate.configure_calls if "activebackground" in call]
+
+    assert len(painted) == 1
+    assert alternate.gridded and not button.gridded
+    _run_idle()
+    assert edmc_theme.updated == [alternate]
+
+
+def test_alternate_forgotten_when_either_widget_is_destroyed(fake_style: _FakeStyle) -> None:
+    class _Event:
+        def __init__(self, widget: Any) -> None:
+            self.widget = widget
+
+    adapter = ThemeAdapter()
+    pairs = []
+    for _ in range(2):
+        button, alternate = _FakeButton(), _FakeLabel()
+        adapter._track_alternate(button, alternate)
+        pairs.append((button, alternate))
+
+    (first_button, _), (second_button, second_alternate) = pairs
+    first_button.bindings["<Destroy>"][0](_Event(first_button))
+    second_alternate.bindings["<Destroy>"][0](_Event(second_alternate))
+
+    assert first_button not in adapter._alternate_buttons
+    assert second_button not in adapter._alternate_buttons
+
+
+def test_alternate_handlers_ignore_unmapped_widget_paths(fake_style: _FakeStyle) -> None:
+    class _Event:
+        def __init__(self, widget: Any) -> None:
+            self.widget = widget
+
+    adapter = ThemeAdapter()
+    button, alternate = _FakeButton(), _FakeLabel()
+    adapter._track_alternate(button, alternate)
+
+    adapter._forget_alternate(_Event(".!frame.!label"))
+    adapter._invoke_alternate_master(_Event(".!frame.!label"))
+
+    assert adapter._alternate_buttons[button] is alternate
+
+
+def test_button_configure_wrapped_only_once(
+    monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle
+) -> None:
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", _FakeEdmcTheme())
+    adapter = ThemeAdapter()
+    button = _FakeButton()
+
+    adapter._wrap_button_configure(button)
+    wrapped = button.configure
+    adapter._wrap_button_configure(button)
+
+    assert button.configure is wrapped
+    assert button in adapter._wrapped_buttons
+
+
+def test_wrapped_config_alias_mirrors_onto_alternate(
+    monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle
+) -> None:
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", _FakeEdmcTheme())
+    adapter = ThemeAdapter()
+    button = _FakeButton()
+    button.options.update(state="normal")
+    alternate = _FakeLabel()
+    alternate.options.update(state="normal")
+    adapter._alternate_buttons[button] = alternate
+    adapter._wrap_button_configure(button)
+
+    assert "text" in button.configure()
+    assert alternate.configure_calls == []
+
+    button.config(state="disabled")
+
+    assert button.configure is button.config
+    assert alternate.options["state"] == "disabled"
+
+
+def test_widget_class_queried_once_per_widget(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    adapter = ThemeAdapter()
+    label = _FakeLabel()
+    calls: list[str] = []
+    original = label.winfo_class
+
+    def _counting_winfo_class() -> str:
+        calls.append("winfo_class")
+        return original()
+
+    monkeypatch.setattr(label, "winfo_class", _counting_winfo_class)
+    adapter.register(label)
+    adapter._restyle_registered_widgets()
+    adapter.get_background_color(label)
+
+    assert calls == ["winfo_class"]
+
+
+def test_activation_check_is_a_single_shared_shot(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    edmc_theme = _FakeEdmcTheme()
+    edmc_theme.active = None  # type: ignore[assignment]
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", edmc_theme)
+    adapter = ThemeAdapter()
+    buttons = [_FakeButton() for _ in range(3)]
+    _IDLE_QUEUE.clear()
+
+    for button in buttons:
+        adapter._schedule_theme_activation_check(button)
+
+    assert len(_IDLE_QUEUE) == 1
+    _run_idle()
+    assert not adapter._activation_check_pending
+    assert _IDLE_QUEUE == []
+
+
+def test_restyle_prunes_destroyed_widgets_after_the_walk(fake_style: _FakeStyle) -> None:
+    adapter = ThemeAdapter()
+    live, dead = _FakeLabel(), _FakeLabel()
+    adapter.register(live)
+    adapter.register(dead)
+    dead.alive = False
+
+    adapter._restyle_registered_widgets()
+
+    assert set(adapter._plain_widgets) == {live}
+
+
+def test_set_button_text_uses_shared_variable(fake_style: _FakeStyle) -> None:
+    class _FakeVar:
+        def __init__(self) -> None:
+            self.value = ""
+
+        def set(self, value: str) -> None:
+            self.value = value
+
+    adapter = ThemeAdapter()
+    button, alternate = _FakeButton(), _FakeLabel()
+    adapter._alternate_buttons[button] = alternate
+    variable = _FakeVar()
+    adapter._text_vars[button] = variable  # type: ignore[assignment]
+
+    adapter.set_button_text(button, "Stop")
+
+    assert variable.value == "Stop"
+    assert button.configure_calls == []
+    assert alternate.configure_calls == []
+
+
+def test_configure_text_routes_through_shared_variable(
+    monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle
+) -> None:
+    class _FakeVar:
+        def __init__(self) -> None:
+            self.value = ""
+
+        def set(self, value: str) -> None:
+            self.value = value
+
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", _FakeEdmcTheme())
+    adapter = ThemeAdapter()
+    button = _FakeButton()
+    button.options.update(state="normal")
+    alternate = _FakeLabel()
+    alternate.options.update(state="normal")
+    adapter._alternate_buttons[button] = alternate
+    variable = _FakeVar()
+    adapter._text_vars[button] = variable  # type: ignore[assignment]
+    adapter._wrap_button_configure(button)
+
+    button.configure(text="Stop")
+    assert variable.value == "Stop"
+    assert button.configure_calls == []
+
+    button.config({"text": "Go", "state": "disabled"})
+    assert variable.value == "Go"
+    assert button.configure_calls == [{"state": "disabled"}]
+    assert "text" not in alternate.configure_calls[-1]
+    assert alternate.options["state"] == "disabled"
+
+
+def test_checkbox_theme_handler_is_shared(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    class _Event:
+        def __init__(self, widget: Any) -> None:
+            self.widget = widget
+
+    config = _FakeConfig({"theme": 0})
+    monkeypatch.setattr(theme_adapter_module, "edmc_config", config)
+    adapter = ThemeAdapter()
+    first, second = _FakeCheckbutton(), _FakeCheckbutton()
+    adapter.style_checkbox(first)
+    adapter.style_checkbox(second)
+    first_handlers = first.bindings["<<ThemeChanged>>"]
+    second_handlers = second.bindings["<<ThemeChanged>>"]
+
+    assert first_handlers[-1] == second_handlers[-1]
+
+    config.data["theme"] = 1
+    adapter._theme_dirty = True
+    first_handlers[-1](_Event(first))
+
+    assert first.options["selectcolor"] == "black"
+
+
+def test_alternate_palette_skips_repaint_until_palette_changes(
+    monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle
+) -> None:
+    edmc_theme = _FakeEdmcTheme(active=1)
+    edmc_theme.current = {"background": "#050505"}
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", edmc_theme)
+    adapter = ThemeAdapter()
+    alternate = _FakeLabel()
+
+    adapter._apply_alternate_palette(alternate)
+    adapter._apply_alternate_palette(alternate)
+    assert len(alternate.configure_calls) == 1
+
+    adapter._apply_alternate_palette(alternate, force=True)
+    assert len(alternate.configure_calls) == 2
+
+    edmc_theme.current = {"background": "#0a0a0a"}
+    adapter._apply_alternate_palette(alternate)
+    assert len(alternate.configure_calls) == 3
+    assert alternate.options["background"] == "#0a0a0a"
+
+
+def test_ttk_style_created_on_first_lookup(fake_style: _FakeStyle) -> None:
+    adapter = ThemeAdapter()
+    assert ThemeAdapter._STYLE is None
+
+    adapter.default_text_color()
+
+    assert ThemeAdapter._STYLE is fake_style
+
+
+def test_current_theme_color_cached_per_palette(monkeypatch: pytest.MonkeyPatch, fake_style: _FakeStyle) -> None:
+    edmc_theme = _FakeEdmcTheme(active=1)
+    edmc_theme.current = {"foreground": " #123456 "}
+    monkeypatch.setattr(theme_adapter_module, "edmc_theme", edmc_theme)
+    adapter = ThemeAdapter()
+
+    assert adapter.button_foreground_color() == "#123456"
+    edmc_theme.current["foreground"] = "#654321"
+    assert adapter.button_foreground_color() == "#123456"
+
+    edmc_theme.current = {"foreground": "  "}
+    assert adapter._current_theme_color("foreground") is None
+
+
+def test_default_snapshot_reads_one_configure_query(fake_style: _FakeStyle) -> None:
+    class _AliasCheckbutton(_FakeCheckbutton):
+        def configure(self, cnf: Any = None, **kwargs: Any) -> Any:
+            result = super().configure(cnf, **kwargs)
+            if cnf is None and not kwargs:
+                result["borderwidth"] = result.pop("bd")
+                result["bd"] = ("bd", "-borderwidth")
+            return result
+
+        config = configure
+
+    checkbox = _AliasCheckbutton()
+    checkbox.options["bd"] = 3
+
+    snapshot = ThemeAdapter._snapshot_options(checkbox, ("bd", "selectcolor", "style"))
+
+    assert snapshot == {"bd": 3, "selectcolor": "white"}
+
+
+def test_apply_widget_options_bulk_then_per_option_fallback() -> None:
+    label = _FakeLabel()
+
+    ThemeAdapter._apply_widget_options(label, {"background": "#111111", "foreground": "#222222"})
+    assert label.configure_calls == [{"background": "#111111", "foreground": "#222222"}]
+
+    ThemeAdapter._apply_widget_options(label, {"background": "#333333", "bogus": 1})
+    assert label.configure_calls[-1] == {"background": "#333333"}
+    assert len(label.configure_calls) == 2
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from edmc_mining_analytics import tooltip as tooltip_module
+from edmc_mining_analytics.tooltip import WidgetTooltip
+
+
+class _FakeWidget:
+    def __init__(self) -> None:
+        self.bindings: dict[str, list] = {}
+        self.timers: dict[str, object] = {}
+
+    def bind(self, sequence, callback, add=None):
+        self.bindings.setdefault(sequence, []).append(callback)
+
+    def after(self, _delay, callback):
+        job = f"after#{len(self.timers) + 1}"
+        self.timers[job] = callback
+        return job
+
+    def after_cancel(self, job) -> None:
+        self.timers.pop(job, None)
+
+
+def _motion(x: int) -> SimpleNamespace:
+    return SimpleNamespace(x=x, y=0, x_root=x, y_root=0)
+
+
+def test_motion_burst_repositions_once(monkeypatch) -> None:
+    widget = _FakeWidget()
+    tooltip = WidgetTooltip(widget, text="hint")  # type: ignore[arg-type]
+    shown: list[int] = []
+    monkeypatch.setattr(tooltip, "_show", lambda x, _y: shown.append(x))
+
+    for x in range(5):
+        tooltip._on_motion(_motion(x))
+
+    assert shown == []
+    assert len(widget.timers) == 1
+    widget.timers.pop(next(iter(widget.timers)))()
+    assert shown == [4 + 12]
+
+
+def test_leave_cancels_pending_motion(monkeypatch) -> None:
+    widget = _FakeWidget()
+    tooltip = WidgetTooltip(widget, text="hint")  # type: ignore[arg-type]
+    monkeypatch.setattr(tooltip, "_show", lambda *_: None)
+
+    tooltip._on_motion(_motion(1))
+    tooltip._on_leave(_motion(1))
+
+    assert widget.timers == {}
+
+
+def test_style_colors_cached_until_theme_changes(monkeypatch) -> None:
+    lookups: list[tuple[str, str]] = []
+
+    class _Style:
+        def __init__(self, *_args) -> None:
+            pass
+
+        def lookup(self, style: str, option: str) -> str:
+            lookups.append((style, option))
+            return "#101010"
+
+    monkeypatch.setattr(tooltip_module.ttk, "Style", _Style)
+    widget = _FakeWidget()
+    tooltip = WidgetTooltip(widget, text="hint")  # type: ignore[arg-type]
+    tooltip_module._invalidate_style_colors()
+
+    assert tooltip._resolve_colors() == ("#101010", "#101010")
+    tooltip._resolve_colors()
+    assert len(lookups) == 3
+
+    for callback in widget.bindings["<<ThemeChanged>>"]:
+        callback(None)
+    tooltip._resolve_colors()
+    assert len(lookups) == 6
+    tooltip_module._invalidate_style_colors()